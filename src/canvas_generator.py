@@ -5,17 +5,69 @@ This module generates JSON Canvas files that visualize family relationships
 from GEDCOM data in a generational tree layout compatible with Obsidian.
 """
 
+import hashlib
 import json
 import logging
 import os
-import uuid
-from typing import List, Dict, Tuple
+import re
+import shutil
+import sys
+import tempfile
+from array import array
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from collections import deque
+from operator import methodcaller
+import gedcom_parser
 from individual import Individual
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Four-digit year inside a GEDCOM date ("1850", "ABT 1850", "1 JAN 1850")
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+
+# Cached canvases live here, relative to the output directory
+CANVAS_CACHE_DIR = '.canvas_cache'
+
+# Sources the canvas output depends on; editing any of them invalidates the cache
+_CACHE_KEY_SOURCES = (
+    __file__,
+    sys.modules[Individual.__module__].__file__,
+    gedcom_parser.__file__,
+)
+
+
+class _TreeEntry:
+    """Per-person record in a tree structure built by CanvasGenerator."""
+
+    __slots__ = ('individual', 'generation', 'spouses', 'children', 'parents')
+
+    def __init__(self, individual: Individual, generation: int,
+                 spouses: List[str], children: List[str], parents: List[str]):
+        self.individual = individual
+        self.generation = generation
+        self.spouses = spouses
+        self.children = children
+        self.parents = parents
+
+
+class _DescendantFrame:
+    """One parent's pending children in CanvasGenerator._layout_descendants_left."""
+
+    __slots__ = ('children', 'x', 'next_y', 'child_heights')
+
+    def __init__(self, children: Iterator[str], x: float, next_y: float,
+                 child_heights: Dict[str, float]):
+        self.children = children  # Iterator over the children not yet visited
+        self.x = x  # Column all of these children go in
+        self.next_y = next_y  # Where the next child is placed
+        self.child_heights = child_heights  # Family height per child
+
 
 class CanvasGenerator:
     """Generates Obsidian Canvas files for family tree visualization."""
@@ -29,6 +81,10 @@ class CanvasGenerator:
     IMAGE_HEIGHT = 350  # Height for nodes with images (increased to show image + name)
     TREE_SPACING = 400  # Space between disconnected trees
 
+    # Vertical growth direction, used as a sign on y offsets
+    GROW_UP = -1  # Towards negative y
+    GROW_DOWN = 1  # Towards positive y
+
     def __init__(self, individuals: List[Individual], output_dir: str):
         """
         Initialize the canvas generator.
@@ -41,33 +97,86 @@ class CanvasGenerator:
         self.output_dir = output_dir
 
         # Create lookup dictionary for fast access
-        self.individual_map: Dict[str, Individual] = {
-            ind.get_pointer(): ind for ind in individuals
+        self.individual_map: Dict[str, Individual] = dict(
+            zip(map(methodcaller('get_pointer'), individuals), individuals)
+        )
+
+        # Cache accessor results once per person; the layout passes below
+        # would otherwise re-walk the same GEDCOM elements many times
+        self._meta: Dict[str, Dict] = {
+            pointer: {
+                'names': ind.get_names(),
+                'gender': ind.get_gender(),
+                'birth_year': self._birth_year(ind),
+                'images': ind.get_images(),
+            }
+            for pointer, ind in self.individual_map.items()
         }
 
-        # Canvas data structures
-        self.nodes: List[Dict] = []
-        self.edges: List[Dict] = []
+        # Relationship adjacency (person_id -> list of person_ids)
+        self._parents_of: Dict[str, List[str]] = {}
+        self._children_of: Dict[str, List[str]] = {}
+        self._spouses_of: Dict[str, List[str]] = {}
+        self._build_adjacency()
+
+        # Sibling lists for the tree currently being laid out (see _get_siblings)
+        self._sibling_cache: Dict[str, List[str]] = {}
+        self._sibling_cache_tree = None
+
+        # Canvas data, stored column-wise; dicts are only built when writing
+        self._next_id = 0  # Node/edge ids only need to be unique within the file
+        self._node_ids: List[str] = []
+        self._node_text: List[str] = []
+        self._node_x: List[float] = []
+        self._node_y: List[float] = []
+        self._node_height = array('i')
+        self._max_x = float('-inf')  # Right edge of the rightmost node so far
+        self._edge_ids: List[str] = []
+        self._edge_from: List[str] = []
+        self._edge_from_side: List[str] = []
+        self._edge_to: List[str] = []
+        self._edge_to_side: List[str] = []
+        self._edge_label: List[str] = []
+        self._edge_bidirectional: List[bool] = []
 
         logger.info(f"Initialized CanvasGenerator with {len(individuals)} individuals")
 
-    def generate_canvas(self, root_person_id: str, canvas_filename: str = "Family Tree.canvas") -> str:
+    def generate_canvas(self, root_person_id: str, canvas_filename: str = "Family Tree.canvas",
+                        source_path: Optional[str] = None) -> str:
         """
         Generate canvas file with family tree visualization.
 
+        When ``source_path`` is given, the finished canvas is also stored in
+        ``output_dir/.canvas_cache`` under a hash of the GEDCOM file, the root
+        person and the converter's own sources. A later run with the same
+        inputs copies the cached file instead of laying the tree out again.
+        Only the latest entry per root person is kept.
+
         Args:
             root_person_id: GEDCOM pointer of the root person
             canvas_filename: Name of the output canvas file
+            source_path: GEDCOM file the individuals were parsed from, used
+                as the cache key (no caching if None)
 
         Returns:
             Path to the generated canvas file
         """
-        logger.info(f"Generating canvas with root person: {root_person_id}")
-        logger.info(f"Total individuals in GEDCOM: {len(self.individuals)}")
+        canvas_path = os.path.join(self.output_dir, canvas_filename)
+
+        cache_path = None
+        if source_path is not None:
+            cache_path = self._canvas_cache_path(source_path, root_person_id)
+            if os.path.exists(cache_path):
+                shutil.copyfile(cache_path, canvas_path)
+                logger.info("Canvas for %s unchanged, copied from cache: %s", root_person_id, cache_path)
+                return canvas_path
+
+        logger.info("Generating canvas with root person: %s", root_person_id)
+        logger.info("Total individuals in GEDCOM: %d", len(self.individuals))
 
         # Build family tree structure starting from root
         tree_structure = self._build_tree_structure(root_person_id)
-        logger.info(f"Main tree contains {len(tree_structure)} people connected to root")
+        logger.info("Main tree contains %d people connected to root", len(tree_structure))
 
         # Calculate node positions using generational layout
         positioned_nodes = self._calculate_positions(tree_structure)
@@ -79,88 +188,165 @@ class CanvasGenerator:
         self._add_disconnected_trees(tree_structure)
 
         # Write canvas file
-        canvas_path = os.path.join(self.output_dir, canvas_filename)
         self._write_canvas_file(canvas_path)
 
-        logger.info(f"Canvas generated with {len(self.nodes)} nodes and {len(self.edges)} edges")
-        logger.info(f"Total people represented: {len(self.nodes)}/{len(self.individuals)}")
+        if cache_path is not None:
+            self._store_in_cache(canvas_path, cache_path)
+
+        logger.info("Canvas generated with %d nodes and %d edges", len(self._node_ids), len(self._edge_ids))
+        logger.info("Total people represented: %d/%d", len(self._node_ids), len(self.individuals))
         return canvas_path
 
-    def _build_tree_structure(self, root_id: str) -> Dict[str, Dict]:
+    def _canvas_cache_path(self, source_path: str, root_person_id: str) -> str:
         """
-        Build tree structure starting from root person using BFS.
+        Return the cache file for a GEDCOM file and root person.
 
-        Returns a dict mapping person_id -> {
-            'individual': Individual,
-            'generation': int,
-            'spouses': List[str],
-            'children': List[str],
-            'parents': List[str]
-        }
+        The name is ``<root>.<key>.canvas``: the root prefix lets stale entries
+        for the same person be found and pruned, the key changes whenever an
+        input changes.
         """
-        structure = {}
-        visited = set()
-        queue = deque([(root_id, 0)])  # (person_id, generation)
+        root_prefix = re.sub(r'[^A-Za-z0-9_-]', '', root_person_id) or '_'
+        cache_key = self._canvas_cache_key(source_path, root_person_id)
+        return os.path.join(self.output_dir, CANVAS_CACHE_DIR, f"{root_prefix}.{cache_key}.canvas")
 
-        while queue:
-            person_id, generation = queue.popleft()
-
-            if person_id in visited or person_id not in self.individual_map:
-                continue
+    @staticmethod
+    def _canvas_cache_key(source_path: str, root_person_id: str) -> str:
+        """
+        Hash everything the canvas output depends on.
 
-            visited.add(person_id)
-            individual = self.individual_map[person_id]
+        Covers the GEDCOM file, the root person and the sources listed in
+        _CACHE_KEY_SOURCES, so that code changes invalidate cached canvases.
+        """
+        digest = hashlib.sha256()
+        with open(source_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        digest.update(b'\0' + root_person_id.encode('utf-8') + b'\0')
+        for source in _CACHE_KEY_SOURCES:
+            with open(source, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _store_in_cache(canvas_path: str, cache_path: str):
+        """
+        Copy a written canvas into the cache and drop older entries for its root.
 
-            # Initialize structure for this person
-            structure[person_id] = {
-                'individual': individual,
-                'generation': generation,
-                'spouses': [],
-                'children': [],
-                'parents': []
-            }
+        The copy goes to a temporary file first and is renamed into place,
+        so an interrupted run never leaves a truncated cache entry. Failures
+        are logged and otherwise ignored; the cache is only an optimization.
+        """
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            os.close(fd)
+            try:
+                shutil.copyfile(canvas_path, tmp_path)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            # Entries for the same root from earlier GEDCOM or code revisions
+            cache_name = os.path.basename(cache_path)
+            root_prefix = cache_name.split('.', 1)[0]
+            for entry in os.listdir(cache_dir):
+                if (entry != cache_name and entry.startswith(root_prefix + '.')
+                        and entry.endswith('.canvas')):
+                    os.remove(os.path.join(cache_dir, entry))
+        except OSError as e:
+            logger.warning("Could not cache canvas in %s: %s", cache_dir, e)
+
+    @property
+    def nodes(self) -> List[Dict]:
+        """Canvas node records, materialized from the column store."""
+        return list(self._iter_nodes())
+
+    @property
+    def edges(self) -> List[Dict]:
+        """Canvas edge records, materialized from the column store."""
+        return list(self._iter_edges())
+
+    def _build_adjacency(self):
+        """
+        Resolve parent, child and spouse links for every individual once.
 
-            # Get families where this person is a child (to find parents)
-            families_as_child = individual.get_families_as_child()
-            for family in families_as_child:
-                # Add parents
+        Parents keep the father-then-mother order of each family; spouses and
+        children are deduplicated in first-seen order.
+        """
+        for person_id, individual in self.individual_map.items():
+            parents = []
+            for family in individual.get_families_as_child():
                 if family.get('father'):
-                    father_id = family['father']
-                    structure[person_id]['parents'].append(father_id)
-                    if father_id not in visited:
-                        queue.append((father_id, generation - 1))
-
+                    parents.append(family['father'])
                 if family.get('mother'):
-                    mother_id = family['mother']
-                    structure[person_id]['parents'].append(mother_id)
-                    if mother_id not in visited:
-                        queue.append((mother_id, generation - 1))
-
-            # Get families where this person is a spouse (to find spouses and children)
-            families = individual.get_families()
-            for family in families:
-                # Add spouse
+                    parents.append(family['mother'])
+
+            # Dicts act as insertion-ordered sets for O(1) deduplication
+            spouses = {}
+            children = {}
+            for family in individual.get_families():
                 partner = family.get('partner')
                 if partner:
                     spouse_id = partner.get_pointer()
-                    if spouse_id and spouse_id not in structure[person_id]['spouses']:
-                        structure[person_id]['spouses'].append(spouse_id)
-                        if spouse_id not in visited:
-                            queue.append((spouse_id, generation))
-
-                # Add children
-                children = family.get('children', [])
-                for child in children:
+                    if spouse_id:
+                        spouses[spouse_id] = None
+
+                for child in family.get('children', []):
                     child_id = child.get_pointer()
-                    if child_id and child_id not in structure[person_id]['children']:
-                        structure[person_id]['children'].append(child_id)
-                        if child_id not in visited:
-                            queue.append((child_id, generation + 1))
+                    if child_id:
+                        children[child_id] = None
+
+            self._parents_of[person_id] = parents
+            self._spouses_of[person_id] = list(spouses)
+            self._children_of[person_id] = list(children)
+
+    def _build_tree_structure(self, root_id: str, within: Optional[Set[str]] = None) -> Dict[str, _TreeEntry]:
+        """
+        Build tree structure starting from root person using BFS.
+
+        If ``within`` is given, the search does not leave that set of people.
+
+        Returns a dict mapping person_id -> _TreeEntry (individual, generation,
+        and spouse/child/parent id lists).
+        """
+        structure = {}
+        members = self.individual_map if within is None else within
+        if root_id not in members:
+            return structure
+
+        # Mark people when they are queued rather than when they are popped, so
+        # nobody is queued twice. The queue is FIFO, so each person still gets
+        # the generation of the path that reached them first.
+        seen = {root_id}
+        queue = deque([(root_id, 0)])  # (person_id, generation)
+
+        while queue:
+            person_id, generation = queue.popleft()
+            individual = self.individual_map[person_id]
+
+            parents = self._parents_of[person_id]
+            spouses = self._spouses_of[person_id]
+            children = self._children_of[person_id]
+
+            # Adjacency lists are shared, not copied; layout code only reads them
+            structure[person_id] = _TreeEntry(individual, generation, spouses, children, parents)
+
+            for relatives, relative_generation in (
+                (parents, generation - 1),
+                (spouses, generation),
+                (children, generation + 1),
+            ):
+                for relative_id in relatives:
+                    if relative_id not in seen and relative_id in members:
+                        seen.add(relative_id)
+                        queue.append((relative_id, relative_generation))
 
         logger.info(f"Built tree structure with {len(structure)} people from root {root_id}")
         return structure
 
-    def _calculate_positions(self, tree_structure: Dict[str, Dict]) -> Dict[str, Tuple[int, int]]:
+    def _calculate_positions(self, tree_structure: Dict[str, _TreeEntry]) -> Dict[str, Tuple[int, int]]:
         """
         Calculate positions using left-to-right timeline layout.
 
@@ -174,19 +360,18 @@ class CanvasGenerator:
 
         Returns dict mapping person_id -> (x, y)
         """
+        couple_step = self.IMAGE_HEIGHT + self.COUPLE_SPACING  # Person to partner
+        sibling_step = self.IMAGE_HEIGHT + self.SIBLING_SPACING  # Person to next sibling
+
         positions = {}
 
         if not tree_structure:
             return positions
 
-        # Find root person (generation 0)
-        root_id = None
-        for person_id, data in tree_structure.items():
-            if data['generation'] == 0:
-                root_id = person_id
-                break
+        # Find root person (generation 0); the BFS always records it first
+        root_id = next(iter(tree_structure))
 
-        if not root_id:
+        if tree_structure[root_id].generation != 0:
             logger.error("No root person found at generation 0")
             return positions
 
@@ -196,31 +381,29 @@ class CanvasGenerator:
         positions[root_id] = (0, 0)
         processed = {root_id}
 
-        # Shared dict to track next available y position at each x coordinate
-        # This prevents overlaps when multiple family branches use the same x
+        # Shared dicts (one per growth direction) to track next available y position
+        # at each x coordinate. This prevents overlaps when multiple family branches use the same x
         shared_min_y_at_x = {}
 
         # Determine direction based on gender
         # Male: grow upward (negative y), Female: grow downward (positive y)
-        root_individual = tree_structure[root_id]['individual']
-        root_gender = root_individual.get_gender()
-        root_direction = 'up' if root_gender == 'M' else 'down'
+        root_gender = self._meta[root_id]['gender']
+        root_direction = self.GROW_UP if root_gender == 'M' else self.GROW_DOWN
         logger.info(f"Root person gender: {root_gender}, direction: {root_direction}")
 
         # Place spouse vertically adjacent
         root_data = tree_structure[root_id]
-        spouses = root_data.get('spouses', [])
+        spouses = root_data.spouses
         if spouses:
             spouse_id = spouses[0]
             if spouse_id in tree_structure:
-                spouse_y = self.IMAGE_HEIGHT + self.COUPLE_SPACING
+                spouse_y = couple_step
                 positions[spouse_id] = (0, spouse_y)
                 processed.add(spouse_id)
 
                 # Determine spouse direction based on gender
-                spouse_individual = tree_structure[spouse_id]['individual']
-                spouse_gender = spouse_individual.get_gender()
-                spouse_direction = 'up' if spouse_gender == 'M' else 'down'
+                spouse_gender = self._meta[spouse_id]['gender']
+                spouse_direction = self.GROW_UP if spouse_gender == 'M' else self.GROW_DOWN
 
                 # Position spouse's siblings and their families
                 self._position_spouse_siblings(spouse_id, 0, spouse_y, tree_structure, positions, processed, spouse_direction)
@@ -234,7 +417,7 @@ class CanvasGenerator:
         self._layout_ancestors_right(root_id, tree_structure, positions, processed, root_direction, shared_min_y_at_x)
 
         # Position any remaining unprocessed people
-        unprocessed = set(tree_structure.keys()) - processed
+        unprocessed = [pid for pid in tree_structure if pid not in processed]
         if unprocessed:
             logger.info(f"Positioning {len(unprocessed)} remaining unconnected people")
             # Place them far to the right as a separate tree
@@ -242,17 +425,17 @@ class CanvasGenerator:
             current_y = 0
             for person_id in unprocessed:
                 positions[person_id] = (max_x + self.TREE_SPACING, current_y)
-                current_y += self.IMAGE_HEIGHT + self.SIBLING_SPACING
+                current_y += sibling_step
                 processed.add(person_id)
 
-        logger.info(f"Positioned {len(positions)} out of {len(tree_structure)} people")
+        logger.info("Positioned %s out of %s people", len(positions), len(tree_structure))
 
         return positions
 
     def _layout_descendants_left(
         self,
         root_id: str,
-        tree_structure: Dict[str, Dict],
+        tree_structure: Dict[str, _TreeEntry],
         positions: Dict[str, Tuple[int, int]],
         processed: set
     ):
@@ -261,21 +444,88 @@ class CanvasGenerator:
 
         Each child is positioned to the left of their parent.
         Siblings are stacked vertically.
+
+        Generations are walked depth-first with an explicit stack (one frame per
+        parent whose children are being placed) instead of recursion; each child's
+        descendants are still laid out before the next sibling.
         """
-        if root_id not in tree_structure or root_id not in positions:
-            return
+        couple_step = self.IMAGE_HEIGHT + self.COUPLE_SPACING  # Person to partner
 
-        root_data = tree_structure[root_id]
-        children = root_data.get('children', [])
+        frame = self._descendant_frame(root_id, tree_structure, positions)
+        stack = [frame] if frame else []
+
+        while stack:
+            frame = stack[-1]
+            child_x = frame.x
+            current_y = frame.next_y
+
+            for child_id in frame.children:
+                if child_id in processed or child_id not in tree_structure:
+                    continue
+
+                positions[child_id] = (child_x, current_y)
+                processed.add(child_id)
+
+                # Position child's spouse below them
+                child_data = tree_structure[child_id]
+                child_spouses = child_data.spouses
+                if child_spouses:
+                    spouse_id = child_spouses[0]
+                    if spouse_id in tree_structure and spouse_id not in processed:
+                        spouse_y = current_y + couple_step
+                        positions[spouse_id] = (child_x, spouse_y)
+                        processed.add(spouse_id)
+
+                        # Determine spouse direction based on gender
+                        spouse_gender = self._meta[spouse_id]['gender']
+                        spouse_direction = self.GROW_UP if spouse_gender == 'M' else self.GROW_DOWN
+
+                        # Position spouse's siblings and their families
+                        self._position_spouse_siblings(spouse_id, child_x, spouse_y, tree_structure, positions, processed, spouse_direction)
+                        # Position spouse's ancestors (parents, grandparents, etc.)
+                        # Note: we don't pass shared_min_y_at_x here because this is from _layout_descendants_left
+                        # which doesn't have access to it. This could cause overlaps for deep trees.
+                        self._layout_ancestors_right(spouse_id, tree_structure, positions, processed, spouse_direction)
+
+                # Move down for next sibling (independent of this child's own descendants)
+                frame.next_y = current_y + frame.child_heights.get(child_id, self.IMAGE_HEIGHT) + self.SIBLING_SPACING
+
+                # Layout this child's descendants (further left) before the next sibling
+                child_frame = self._descendant_frame(child_id, tree_structure, positions)
+                if child_frame:
+                    stack.append(child_frame)
+                break
+            else:
+                # All children of this parent are placed
+                stack.pop()
+
+    def _descendant_frame(
+        self,
+        root_id: str,
+        tree_structure: Dict[str, _TreeEntry],
+        positions: Dict[str, Tuple[int, int]]
+    ) -> Optional[_DescendantFrame]:
+        """
+        Prepare the placement of one person's children for _layout_descendants_left.
+
+        Returns a _DescendantFrame positioned one generation left of the person,
+        or None if the person is not positioned or has no children.
+        """
+        # One lookup per dict; a missing entry means there is nothing to place
+        root_data = tree_structure.get(root_id)
+        root_position = positions.get(root_id)
+        if root_data is None or root_position is None:
+            return None
+
+        children = root_data.children
 
         if not children:
-            return
+            return None
 
-        # Get root position
-        root_x, root_y = positions[root_id]
+        root_x, root_y = root_position
 
         # Check if root has spouse - need to center children between root and spouse
-        spouses = root_data.get('spouses', [])
+        spouses = root_data.spouses
         if spouses and spouses[0] in positions:
             spouse_x, spouse_y = positions[spouses[0]]
             parent_center_y = (root_y + spouse_y) / 2
@@ -290,7 +540,7 @@ class CanvasGenerator:
             if child_id not in tree_structure:
                 continue
             # Each child needs space for themselves + their spouse
-            child_height = self._calculate_family_height(child_id, tree_structure, set())
+            child_height = self._calculate_family_height(child_id, tree_structure)
             child_heights[child_id] = child_height
             total_children_height += child_height
 
@@ -301,51 +551,17 @@ class CanvasGenerator:
         # Position children starting from top, centered on parent
         child_x = root_x - self.GENERATION_SPACING
         start_y = parent_center_y - (total_children_height / 2)
-        current_y = start_y
 
-        for child_id in children:
-            if child_id in processed or child_id not in tree_structure:
-                continue
-
-            positions[child_id] = (child_x, current_y)
-            processed.add(child_id)
-
-            # Position child's spouse below them
-            child_data = tree_structure[child_id]
-            child_spouses = child_data.get('spouses', [])
-            if child_spouses:
-                spouse_id = child_spouses[0]
-                if spouse_id in tree_structure and spouse_id not in processed:
-                    spouse_y = current_y + self.IMAGE_HEIGHT + self.COUPLE_SPACING
-                    positions[spouse_id] = (child_x, spouse_y)
-                    processed.add(spouse_id)
-
-                    # Determine spouse direction based on gender
-                    spouse_individual = tree_structure[spouse_id]['individual']
-                    spouse_gender = spouse_individual.get_gender()
-                    spouse_direction = 'up' if spouse_gender == 'M' else 'down'
-
-                    # Position spouse's siblings and their families
-                    self._position_spouse_siblings(spouse_id, child_x, spouse_y, tree_structure, positions, processed, spouse_direction)
-                    # Position spouse's ancestors (parents, grandparents, etc.)
-                    # Note: we don't pass shared_min_y_at_x here because this is from _layout_descendants_left
-                    # which doesn't have access to it. This could cause overlaps for deep trees.
-                    self._layout_ancestors_right(spouse_id, tree_structure, positions, processed, spouse_direction)
-
-            # Recursively layout this child's descendants (further left)
-            self._layout_descendants_left(child_id, tree_structure, positions, processed)
-
-            # Move down for next sibling
-            current_y += child_heights.get(child_id, self.IMAGE_HEIGHT) + self.SIBLING_SPACING
+        return _DescendantFrame(iter(children), child_x, start_y, child_heights)
 
     def _layout_ancestors_right(
         self,
         root_id: str,
-        tree_structure: Dict[str, Dict],
+        tree_structure: Dict[str, _TreeEntry],
         positions: Dict[str, Tuple[int, int]],
         processed: set,
-        direction: str = 'down',
-        min_y_at_x: Dict[int, float] = None
+        direction: int = GROW_DOWN,
+        min_y_at_x: Dict[int, Dict[int, float]] = None
     ):
         """
         Layout ancestors to the right of root person with vertical sibling stacking.
@@ -354,31 +570,34 @@ class CanvasGenerator:
         Parent couples are stacked vertically.
 
         Args:
-            direction: 'up' to grow upward (negative y), 'down' to grow downward (positive y)
-            min_y_at_x: Shared dict tracking next available y at each x position
+            direction: GROW_UP (-1) to grow upward (negative y), GROW_DOWN (+1) to grow downward (positive y)
+            min_y_at_x: Shared per-direction dicts tracking next available y at each x position
         """
-        if root_id not in tree_structure or root_id not in positions:
+        # Signed steps: negative when growing upward
+        couple_step = direction * (self.IMAGE_HEIGHT + self.COUPLE_SPACING)  # Person to partner
+        sibling_step = direction * (self.IMAGE_HEIGHT + self.SIBLING_SPACING)  # Person to next sibling
+
+        # One lookup per dict; a missing entry means there is nothing to place
+        person_data = tree_structure.get(root_id)
+        person_position = positions.get(root_id)
+        if person_data is None or person_position is None:
             return
 
         # Initialize if not provided
         if min_y_at_x is None:
             min_y_at_x = {}
+        # Upward and downward growth are tracked separately, keyed by x
+        column_min_y = min_y_at_x.setdefault(direction, {})
 
         # Process only this person's parents (not spouse's)
         # Spouse's parents will be processed in their own call with their own direction
-        person_id = root_id
-        if person_id not in positions:
-            return
-
-        person_data = tree_structure[person_id]
-        person_name = person_data['individual'].get_names()
-        logger.info(f"Processing ancestors for {person_name}, direction={direction}")
-        parents = person_data.get('parents', [])
+        logger.info("Processing ancestors for %s, direction=%s", self._meta[root_id]['names'], direction)
+        parents = person_data.parents
 
         if not parents:
             return
 
-        person_x, person_y = positions[person_id]
+        person_x, person_y = person_position
         parent_x = person_x + self.GENERATION_SPACING
 
         # Position parent couple
@@ -386,202 +605,148 @@ class CanvasGenerator:
             father_id, mother_id = parents[0], parents[1]
 
             # Check if we need to avoid overlap at this x-position
-            # Use (x, direction) as key to track upward and downward growth separately
-            key = (parent_x, direction)
-            if key in min_y_at_x:
+            if parent_x in column_min_y:
                 # Position relative to existing people at this x-coordinate going this direction
-                parent_y = min_y_at_x[key]
-                logger.info(f"Using min_y_at_x for x={parent_x}, dir={direction}: y={parent_y}")
+                parent_y = column_min_y[parent_x]
+                logger.info("Using min_y_at_x for x=%s, dir=%s: y=%s", parent_x, direction, parent_y)
             else:
                 # Center parent couple on their child
                 parent_y = person_y
-                logger.info(f"Centering parents on child at y={person_y}, direction={direction}")
+                logger.info("Centering parents on child at y=%s, direction=%s", person_y, direction)
 
             if father_id in tree_structure and father_id not in processed:
                 positions[father_id] = (parent_x, parent_y)
                 processed.add(father_id)
-                father_name = tree_structure[father_id]['individual'].get_names()
-                logger.info(f"Positioned father {father_name} at ({parent_x}, {parent_y})")
+                logger.info("Positioned father %s at (%s, %s)", self._meta[father_id]['names'], parent_x, parent_y)
 
             mother_y = parent_y  # Default if mother doesn't exist
             if mother_id in tree_structure and mother_id not in processed:
-                if direction == 'up':
-                    mother_y = parent_y - self.IMAGE_HEIGHT - self.COUPLE_SPACING
-                else:
-                    mother_y = parent_y + self.IMAGE_HEIGHT + self.COUPLE_SPACING
+                mother_y = parent_y + couple_step
 
                 # Check if we need to avoid overlap at this position
-                key = (parent_x, direction)
-                if key in min_y_at_x:
-                    if direction == 'up':
-                        # For upward growth, ensure mother is above the min_y
-                        if mother_y > min_y_at_x[key]:
-                            mother_y = min_y_at_x[key] - self.IMAGE_HEIGHT - self.COUPLE_SPACING
-                            logger.info(f"Adjusted mother position to avoid overlap: y={mother_y}")
-                    else:
-                        # For downward growth, ensure mother is below the min_y
-                        if mother_y < min_y_at_x[key]:
-                            mother_y = min_y_at_x[key] + self.IMAGE_HEIGHT + self.COUPLE_SPACING
-                            logger.info(f"Adjusted mother position to avoid overlap: y={mother_y}")
+                # (mother must lie beyond min_y in the growth direction)
+                if parent_x in column_min_y and direction * mother_y < direction * column_min_y[parent_x]:
+                    mother_y = column_min_y[parent_x] + couple_step
+                    logger.info("Adjusted mother position to avoid overlap: y=%s", mother_y)
 
                 positions[mother_id] = (parent_x, mother_y)
                 processed.add(mother_id)
 
                 # Update min_y_at_x to include the mother's position
-                if direction == 'up':
-                    min_y_at_x[key] = mother_y - self.SIBLING_SPACING - self.IMAGE_HEIGHT
-                    logger.info(f"Updated min_y_at_x[{key}] = {min_y_at_x[key]} after positioning mother")
-                else:
-                    min_y_at_x[key] = mother_y + self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                    logger.info(f"Updated min_y_at_x[{key}] = {min_y_at_x[key]} after positioning mother")
+                column_min_y[parent_x] = mother_y + sibling_step
+                logger.info("Updated min_y_at_x[%s, %s] = %s after positioning mother", parent_x, direction, column_min_y[parent_x])
 
             # Position siblings of both parents at same x-position, stacked vertically
-            if direction == 'up':
-                current_sibling_y = min(parent_y, mother_y) - self.SIBLING_SPACING - self.IMAGE_HEIGHT
-            else:
-                current_sibling_y = max(parent_y, mother_y) + self.IMAGE_HEIGHT + self.SIBLING_SPACING
+            # (start past whichever parent lies further in the growth direction)
+            outer_parent_y = direction * max(direction * parent_y, direction * mother_y)
+            current_sibling_y = outer_parent_y + sibling_step
 
-            # Father's siblings
+            # Father's siblings, then mother's siblings (who aren't already father's siblings)
             father_siblings = self._get_siblings(father_id, tree_structure)
-            for sibling_id in father_siblings:
-                if sibling_id in tree_structure and sibling_id not in processed:
-                    positions[sibling_id] = (parent_x, current_sibling_y)
-                    processed.add(sibling_id)
-                    sibling_name = tree_structure[sibling_id]['individual'].get_names()
-                    logger.info(f"Positioned father sibling {sibling_name} at ({parent_x}, {current_sibling_y})")
-
-                    # Position sibling's spouse
-                    sibling_data = tree_structure[sibling_id]
-                    sibling_spouses = sibling_data.get('spouses', [])
-                    if sibling_spouses:
-                        spouse_id = sibling_spouses[0]
-                        if spouse_id in tree_structure and spouse_id not in processed:
-                            if direction == 'up':
-                                spouse_y = current_sibling_y - self.IMAGE_HEIGHT - self.COUPLE_SPACING
-                            else:
-                                spouse_y = current_sibling_y + self.IMAGE_HEIGHT + self.COUPLE_SPACING
-                            positions[spouse_id] = (parent_x, spouse_y)
-                            processed.add(spouse_id)
-                            # Position spouse's siblings and their families
-                            self._position_spouse_siblings(spouse_id, parent_x, spouse_y, tree_structure, positions, processed, direction)
-                            if direction == 'up':
-                                current_sibling_y = min(current_sibling_y, spouse_y) - self.SIBLING_SPACING - self.IMAGE_HEIGHT
-                            else:
-                                current_sibling_y = max(current_sibling_y, spouse_y) + self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                        else:
-                            if direction == 'up':
-                                current_sibling_y -= self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                            else:
-                                current_sibling_y += self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                    else:
-                        if direction == 'up':
-                            current_sibling_y -= self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                        else:
-                            current_sibling_y += self.IMAGE_HEIGHT + self.SIBLING_SPACING
-
-                    # Position sibling's children (cousins) to the left
-                    self._layout_descendants_left(sibling_id, tree_structure, positions, processed)
-
-            # Mother's siblings (who aren't already father's siblings)
+            current_sibling_y = self._place_sibling_row(
+                father_siblings, parent_x, current_sibling_y, direction,
+                tree_structure, positions, processed
+            )
             mother_siblings = self._get_siblings(mother_id, tree_structure)
-            for sibling_id in mother_siblings:
-                if sibling_id not in father_siblings and sibling_id in tree_structure and sibling_id not in processed:
-                    positions[sibling_id] = (parent_x, current_sibling_y)
-                    processed.add(sibling_id)
-
-                    # Position sibling's spouse
-                    sibling_data = tree_structure[sibling_id]
-                    sibling_spouses = sibling_data.get('spouses', [])
-                    if sibling_spouses:
-                        spouse_id = sibling_spouses[0]
-                        if spouse_id in tree_structure and spouse_id not in processed:
-                            if direction == 'up':
-                                spouse_y = current_sibling_y - self.IMAGE_HEIGHT - self.COUPLE_SPACING
-                            else:
-                                spouse_y = current_sibling_y + self.IMAGE_HEIGHT + self.COUPLE_SPACING
-                            positions[spouse_id] = (parent_x, spouse_y)
-                            processed.add(spouse_id)
-                            # Position spouse's siblings and their families
-                            self._position_spouse_siblings(spouse_id, parent_x, spouse_y, tree_structure, positions, processed, direction)
-                            if direction == 'up':
-                                current_sibling_y = min(current_sibling_y, spouse_y) - self.SIBLING_SPACING - self.IMAGE_HEIGHT
-                            else:
-                                current_sibling_y = max(current_sibling_y, spouse_y) + self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                        else:
-                            if direction == 'up':
-                                current_sibling_y -= self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                            else:
-                                current_sibling_y += self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                    else:
-                        if direction == 'up':
-                            current_sibling_y -= self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                        else:
-                            current_sibling_y += self.IMAGE_HEIGHT + self.SIBLING_SPACING
-
-                    # Position sibling's children (cousins) to the left
-                    self._layout_descendants_left(sibling_id, tree_structure, positions, processed)
+            current_sibling_y = self._place_sibling_row(
+                mother_siblings, parent_x, current_sibling_y, direction,
+                tree_structure, positions, processed, exclude=frozenset(father_siblings)
+            )
 
             # Update the minimum y for this x-position for next iteration
-            key = (parent_x, direction)
-            min_y_at_x[key] = current_sibling_y
+            column_min_y[parent_x] = current_sibling_y
 
             # Recursively position their ancestors (further right)
-            # Process both parents' ancestors (maintain same direction)
-            if father_id in tree_structure:
-                self._layout_ancestors_right(father_id, tree_structure, positions, processed, direction, min_y_at_x)
-            if mother_id in tree_structure:
-                self._layout_ancestors_right(mother_id, tree_structure, positions, processed, direction, min_y_at_x)
+            # Process both parents' ancestors (maintain same direction);
+            # the callee skips parents outside the tree
+            self._layout_ancestors_right(father_id, tree_structure, positions, processed, direction, min_y_at_x)
+            self._layout_ancestors_right(mother_id, tree_structure, positions, processed, direction, min_y_at_x)
 
         elif len(parents) == 1:
             parent_id = parents[0]
             if parent_id in tree_structure and parent_id not in processed:
-                parent_name = tree_structure[parent_id]['individual'].get_names()
 
                 # Check if we need to avoid overlap at this position
-                key = (parent_x, direction)
                 parent_y = person_y
-                if key in min_y_at_x:
-                    if direction == 'up':
-                        # For upward growth, ensure parent is above the min_y
-                        if parent_y > min_y_at_x[key]:
-                            parent_y = min_y_at_x[key] - self.IMAGE_HEIGHT - self.SIBLING_SPACING
-                            logger.info(f"Adjusted single parent position to avoid overlap: y={parent_y}")
-                    else:
-                        # For downward growth, ensure parent is below the min_y
-                        if parent_y < min_y_at_x[key]:
-                            parent_y = min_y_at_x[key] + self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                            logger.info(f"Adjusted single parent position to avoid overlap: y={parent_y}")
+                # (parent must lie beyond min_y in the growth direction)
+                if parent_x in column_min_y and direction * parent_y < direction * column_min_y[parent_x]:
+                    parent_y = column_min_y[parent_x] + sibling_step
+                    logger.info("Adjusted single parent position to avoid overlap: y=%s", parent_y)
 
-                logger.info(f"Single parent case: positioning {parent_name} at ({parent_x}, {parent_y})")
+                logger.info("Single parent case: positioning %s at (%s, %s)", self._meta[parent_id]['names'], parent_x, parent_y)
                 positions[parent_id] = (parent_x, parent_y)
                 processed.add(parent_id)
 
                 # Update min_y_at_x to include this parent's position
-                if direction == 'up':
-                    min_y_at_x[key] = parent_y - self.IMAGE_HEIGHT - self.SIBLING_SPACING
-                else:
-                    min_y_at_x[key] = parent_y + self.IMAGE_HEIGHT + self.SIBLING_SPACING
+                column_min_y[parent_x] = parent_y + sibling_step
 
                 self._layout_ancestors_right(parent_id, tree_structure, positions, processed, direction, min_y_at_x)
 
+    def _place_sibling_row(
+        self,
+        sibling_ids: List[str],
+        parent_x: int,
+        start_y: float,
+        direction: int,
+        tree_structure: Dict[str, _TreeEntry],
+        positions: Dict[str, Tuple[int, int]],
+        processed: set,
+        exclude: frozenset = frozenset()
+    ) -> float:
+        """
+        Stack a parent's siblings (each with their first spouse) in the parent's column.
+
+        Each placed sibling also gets their spouse's siblings and their own
+        children (cousins) laid out. Siblings in ``exclude`` are skipped.
+
+        Returns the y position where the next row entry would go.
+        """
+        # Signed steps: negative when growing upward
+        couple_step = direction * (self.IMAGE_HEIGHT + self.COUPLE_SPACING)
+        sibling_step = direction * (self.IMAGE_HEIGHT + self.SIBLING_SPACING)
+
+        current_y = start_y
+        for sibling_id in sibling_ids:
+            if sibling_id in exclude or sibling_id not in tree_structure or sibling_id in processed:
+                continue
+
+            positions[sibling_id] = (parent_x, current_y)
+            processed.add(sibling_id)
+            logger.info("Positioned parent sibling %s at (%s, %s)", self._meta[sibling_id]['names'], parent_x, current_y)
+
+            # Position sibling's spouse
+            sibling_spouses = tree_structure[sibling_id].spouses
+            spouse_id = sibling_spouses[0] if sibling_spouses else None
+            if spouse_id in tree_structure and spouse_id not in processed:
+                spouse_y = current_y + couple_step
+                positions[spouse_id] = (parent_x, spouse_y)
+                processed.add(spouse_id)
+                # Position spouse's siblings and their families
+                self._position_spouse_siblings(spouse_id, parent_x, spouse_y, tree_structure, positions, processed, direction)
+                current_y = spouse_y + sibling_step
+            else:
+                current_y += sibling_step
+
+            # Position sibling's children (cousins) to the left
+            self._layout_descendants_left(sibling_id, tree_structure, positions, processed)
+
+        return current_y
+
     def _calculate_family_height(
         self,
         person_id: str,
-        tree_structure: Dict[str, Dict],
-        visited: set
+        tree_structure: Dict[str, _TreeEntry]
     ) -> int:
         """
         Calculate total vertical height needed for a person and their spouse.
 
         Returns the height in pixels needed to display this person + spouse.
         """
-        if person_id in visited or person_id not in tree_structure:
+        if person_id not in tree_structure:
             return self.IMAGE_HEIGHT
 
-        visited.add(person_id)
-
         data = tree_structure[person_id]
-        spouses = data.get('spouses', [])
+        spouses = data.spouses
 
         # Height for person
         height = self.IMAGE_HEIGHT
@@ -595,45 +760,55 @@ class CanvasGenerator:
     def _get_siblings(
         self,
         person_id: str,
-        tree_structure: Dict[str, Dict]
+        tree_structure: Dict[str, _TreeEntry]
     ) -> list:
         """
         Get all siblings of a person (people who share the same parents).
 
-        Returns list of sibling IDs.
+        Results are cached per tree structure, since the layout asks for the
+        same people's siblings from several places.
+
+        Returns list of sibling IDs (callers must not modify it).
         """
+        if self._sibling_cache_tree is not tree_structure:
+            self._sibling_cache = {}
+            self._sibling_cache_tree = tree_structure
+        elif person_id in self._sibling_cache:
+            return self._sibling_cache[person_id]
+
         if person_id not in tree_structure:
             return []
 
         person_data = tree_structure[person_id]
-        parents = person_data.get('parents', [])
+        parents = person_data.parents
 
         if not parents:
             return []
 
-        # Find all children of the same parents
-        siblings = []
+        # Find all children of the same parents (dict keeps first-seen order)
+        siblings = {}
 
         # Get children from parents
         for parent_id in parents:
             if parent_id in tree_structure:
                 parent_data = tree_structure[parent_id]
-                parent_children = parent_data.get('children', [])
+                parent_children = parent_data.children
                 for child_id in parent_children:
-                    if child_id != person_id and child_id not in siblings:
-                        siblings.append(child_id)
+                    if child_id != person_id:
+                        siblings[child_id] = None
 
-        return siblings
+        result = self._sibling_cache[person_id] = list(siblings)
+        return result
 
     def _position_spouse_siblings(
         self,
         spouse_id: str,
         spouse_x: int,
         spouse_y: int,
-        tree_structure: Dict[str, Dict],
+        tree_structure: Dict[str, _TreeEntry],
         positions: Dict[str, Tuple[int, int]],
         processed: set,
-        direction: str = 'down'
+        direction: int = GROW_DOWN
     ):
         """
         Position the siblings of a spouse and their families.
@@ -641,36 +816,31 @@ class CanvasGenerator:
         This ensures extended families (e.g., wife's siblings and their families) are included.
 
         Args:
-            direction: 'up' to grow upward (negative y), 'down' to grow downward (positive y)
+            direction: GROW_UP (-1) to grow upward (negative y), GROW_DOWN (+1) to grow downward (positive y)
         """
+        # Signed steps: negative when growing upward
+        couple_step = direction * (self.IMAGE_HEIGHT + self.COUPLE_SPACING)  # Person to partner
+        sibling_step = direction * (self.IMAGE_HEIGHT + self.SIBLING_SPACING)  # Person to next sibling
+
         if spouse_id not in tree_structure:
             return
 
         # Initialize current_y to position elements relative to the spouse
-        if direction == 'up':
-            current_y = spouse_y - self.IMAGE_HEIGHT - self.SIBLING_SPACING
-        else:
-            current_y = spouse_y + self.IMAGE_HEIGHT + self.SIBLING_SPACING
+        current_y = spouse_y + sibling_step
 
         # First, position the spouse's spouse's siblings if they exist
         # (bidirectional spouse relationship)
         spouse_data = tree_structure[spouse_id]
-        spouse_spouses = spouse_data.get('spouses', [])
+        spouse_spouses = spouse_data.spouses
         if spouse_spouses:
             for partner_id in spouse_spouses:
                 if partner_id in tree_structure and partner_id not in processed:
                     # Position the partner relative to the spouse
-                    if direction == 'up':
-                        partner_y = spouse_y - self.IMAGE_HEIGHT - self.COUPLE_SPACING
-                    else:
-                        partner_y = spouse_y + self.IMAGE_HEIGHT + self.COUPLE_SPACING
+                    partner_y = spouse_y + couple_step
                     positions[partner_id] = (spouse_x, partner_y)
                     processed.add(partner_id)
 
-                    if direction == 'up':
-                        current_y = partner_y - self.SIBLING_SPACING - self.IMAGE_HEIGHT
-                    else:
-                        current_y = partner_y + self.IMAGE_HEIGHT + self.SIBLING_SPACING
+                    current_y = partner_y + sibling_step
 
                     # Position the partner's siblings (spouse's in-laws)
                     partner_siblings = self._get_siblings(partner_id, tree_structure)
@@ -681,24 +851,15 @@ class CanvasGenerator:
 
                             # Position this in-law sibling's spouse
                             sib_data = tree_structure[sib_id]
-                            sib_spouses = sib_data.get('spouses', [])
+                            sib_spouses = sib_data.spouses
                             if sib_spouses and sib_spouses[0] in tree_structure and sib_spouses[0] not in processed:
-                                if direction == 'up':
-                                    sib_spouse_y = current_y - self.IMAGE_HEIGHT - self.COUPLE_SPACING
-                                else:
-                                    sib_spouse_y = current_y + self.IMAGE_HEIGHT + self.COUPLE_SPACING
+                                sib_spouse_y = current_y + couple_step
                                 positions[sib_spouses[0]] = (spouse_x, sib_spouse_y)
                                 processed.add(sib_spouses[0])
 
-                                if direction == 'up':
-                                    current_y = sib_spouse_y - self.SIBLING_SPACING - self.IMAGE_HEIGHT
-                                else:
-                                    current_y = sib_spouse_y + self.IMAGE_HEIGHT + self.SIBLING_SPACING
+                                current_y = sib_spouse_y + sibling_step
                             else:
-                                if direction == 'up':
-                                    current_y -= self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                                else:
-                                    current_y += self.IMAGE_HEIGHT + self.SIBLING_SPACING
+                                current_y += sibling_step
 
                             # Position their children
                             self._layout_descendants_left(sib_id, tree_structure, positions, processed)
@@ -713,340 +874,98 @@ class CanvasGenerator:
 
                 # Position this sibling's spouse
                 sibling_data = tree_structure[sibling_id]
-                sibling_spouses = sibling_data.get('spouses', [])
+                sibling_spouses = sibling_data.spouses
                 if sibling_spouses:
                     sibling_spouse_id = sibling_spouses[0]
                     if sibling_spouse_id in tree_structure and sibling_spouse_id not in processed:
-                        if direction == 'up':
-                            sibling_spouse_y = current_y - self.IMAGE_HEIGHT - self.COUPLE_SPACING
-                        else:
-                            sibling_spouse_y = current_y + self.IMAGE_HEIGHT + self.COUPLE_SPACING
+                        sibling_spouse_y = current_y + couple_step
                         positions[sibling_spouse_id] = (spouse_x, sibling_spouse_y)
                         processed.add(sibling_spouse_id)
 
-                        if direction == 'up':
-                            current_y = sibling_spouse_y - self.SIBLING_SPACING - self.IMAGE_HEIGHT
-                        else:
-                            current_y = sibling_spouse_y + self.IMAGE_HEIGHT + self.SIBLING_SPACING
+                        current_y = sibling_spouse_y + sibling_step
                     else:
-                        if direction == 'up':
-                            current_y -= self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                        else:
-                            current_y += self.IMAGE_HEIGHT + self.SIBLING_SPACING
+                        current_y += sibling_step
                 else:
-                    if direction == 'up':
-                        current_y -= self.IMAGE_HEIGHT + self.SIBLING_SPACING
-                    else:
-                        current_y += self.IMAGE_HEIGHT + self.SIBLING_SPACING
+                    current_y += sibling_step
 
                 # Position this sibling's children (to the left)
                 self._layout_descendants_left(sibling_id, tree_structure, positions, processed)
 
-    def _calculate_subtree_widths(
-        self,
-        tree_structure: Dict[str, Dict],
-        person_id: str,
-        visited: set
-    ) -> Dict[str, int]:
-        """
-        Calculate the width needed for each person's subtree (descendants).
-
-        Width is measured in terms of minimum horizontal space needed.
-        """
-        if person_id in visited or person_id not in tree_structure:
-            return {}
-
-        visited.add(person_id)
-        widths = {}
-
-        data = tree_structure[person_id]
-        children = data.get('children', [])
-
-        if not children:
-            # Leaf node: width is just this person + spacing
-            widths[person_id] = self.NODE_WIDTH + self.HORIZONTAL_SPACING
-        else:
-            # Calculate width needed for all children
-            child_widths = 0
-            for child_id in children:
-                if child_id in tree_structure:
-                    child_subtree_widths = self._calculate_subtree_widths(
-                        tree_structure, child_id, visited
-                    )
-                    widths.update(child_subtree_widths)
-                    child_widths += child_subtree_widths.get(
-                        child_id,
-                        self.NODE_WIDTH + self.HORIZONTAL_SPACING
-                    )
-
-            # This person's width is the max of:
-            # 1. Their own width + spouse width
-            # 2. Total width of their children
-            spouses = data.get('spouses', [])
-            own_width = (len(spouses) + 1) * (self.NODE_WIDTH + self.HORIZONTAL_SPACING)
-            widths[person_id] = max(own_width, child_widths)
-
-        return widths
-
-    def _calculate_ancestor_widths(
-        self,
-        tree_structure: Dict[str, Dict],
-        person_id: str,
-        visited: set
-    ) -> Dict[str, int]:
-        """
-        Calculate the width needed for ancestors (going up the tree).
-
-        Similar to _calculate_subtree_widths but follows parent relationships.
-        """
-        if person_id in visited or person_id not in tree_structure:
-            return {}
-
-        visited.add(person_id)
-        widths = {}
-
-        data = tree_structure[person_id]
-        parents = data.get('parents', [])
-
-        if not parents:
-            # No parents: width is just this person + spacing
-            widths[person_id] = self.NODE_WIDTH + self.HORIZONTAL_SPACING
-        else:
-            # Calculate width needed for all parents
-            parent_widths = 0
-            for parent_id in parents:
-                if parent_id in tree_structure:
-                    parent_ancestor_widths = self._calculate_ancestor_widths(
-                        tree_structure, parent_id, visited
-                    )
-                    widths.update(parent_ancestor_widths)
-                    parent_widths += parent_ancestor_widths.get(
-                        parent_id,
-                        self.NODE_WIDTH + self.HORIZONTAL_SPACING
-                    )
-
-            # This person's width is the max of their own width and parents' width
-            widths[person_id] = max(
-                self.NODE_WIDTH + self.HORIZONTAL_SPACING,
-                parent_widths
-            )
-
-        return widths
-
-    def _layout_ancestors(
-        self,
-        root_person_id: str,
-        tree_structure: Dict[str, Dict],
-        positions: Dict[str, Tuple[int, int]],
-        processed: set,
-        subtree_widths: Dict[str, int]
-    ):
-        """
-        Layout ancestors above their children.
-
-        Positions each parent couple directly above their child, creating
-        a compact tree structure rather than spreading all parents horizontally.
-
-        Args:
-            root_person_id: ID of the root person (already positioned)
-            tree_structure: Full tree structure
-            positions: Dict to store calculated positions
-            processed: Set of already-processed person IDs
-            subtree_widths: Pre-calculated widths for all people
-        """
-        # Process all currently positioned people and add their parents
-        # We need to iterate multiple times to handle all ancestor generations
-        max_iterations = 10  # Safety limit
-
-        for iteration in range(max_iterations):
-            # Find all people who are positioned but whose parents aren't yet
-            people_to_process = []
-            for person_id in list(positions.keys()):
-                if person_id not in tree_structure:
-                    continue
-
-                data = tree_structure[person_id]
-                parents = data.get('parents', [])
-
-                # Check if this person has unpositioned parents
-                has_unpositioned_parents = False
-                for parent_id in parents:
-                    if parent_id in tree_structure and parent_id not in processed:
-                        has_unpositioned_parents = True
-                        break
-
-                if has_unpositioned_parents:
-                    people_to_process.append(person_id)
-
-            if not people_to_process:
-                break  # No more parents to position
-
-            # Position parents for each person
-            for person_id in people_to_process:
-                if person_id not in positions:
-                    continue
-
-                child_x, child_y = positions[person_id]
-                data = tree_structure[person_id]
-                parents = data.get('parents', [])
-
-                if not parents:
-                    continue
-
-                # Calculate Y position for parents (one generation above)
-                parent_y = child_y - (self.VERTICAL_SPACING + self.IMAGE_HEIGHT)
-
-                if len(parents) == 2:
-                    # Both parents: center the couple above the child
-                    father_id, mother_id = parents[0], parents[1]
-
-                    # Calculate couple width
-                    couple_width = 2 * self.NODE_WIDTH + self.HORIZONTAL_SPACING
-
-                    # Center couple above child
-                    couple_start_x = child_x - (couple_width - self.NODE_WIDTH) // 2
-
-                    # Position father
-                    if father_id in tree_structure and father_id not in processed:
-                        positions[father_id] = (couple_start_x, parent_y)
-                        processed.add(father_id)
-
-                    # Position mother next to father
-                    mother_x = couple_start_x + self.NODE_WIDTH + self.HORIZONTAL_SPACING
-                    if mother_id in tree_structure and mother_id not in processed:
-                        positions[mother_id] = (mother_x, parent_y)
-                        processed.add(mother_id)
-
-                elif len(parents) == 1:
-                    # Single parent: center above child
-                    parent_id = parents[0]
-                    if parent_id in tree_structure and parent_id not in processed:
-                        positions[parent_id] = (child_x, parent_y)
-                        processed.add(parent_id)
-
-    def _layout_person_and_descendants(
-        self,
-        person_id: str,
-        tree_structure: Dict[str, Dict],
-        positions: Dict[str, Tuple[int, int]],
-        processed: set,
-        subtree_widths: Dict[str, int],
-        x_offset: int,
-        y_pos: int
-    ):
-        """
-        Recursively layout a person, their spouse, and descendants.
-
-        Args:
-            person_id: ID of person to layout
-            tree_structure: Full tree structure
-            positions: Dict to store calculated positions
-            processed: Set of already-processed person IDs
-            subtree_widths: Pre-calculated subtree widths
-            x_offset: Left edge x-coordinate for this person's subtree
-            y_pos: Y-coordinate for this person
-        """
-        if person_id not in tree_structure:
-            return
-
-        if person_id in processed:
-            logger.debug(f"Skipping already processed person: {person_id}")
-            return
-
-        processed.add(person_id)
-        data = tree_structure[person_id]
-        logger.debug(f"Positioning {person_id} at y={y_pos}")
-
-        # Get spouse(s)
-        spouses = data.get('spouses', [])
-
-        # Calculate width for this person + spouses
-        num_people = len(spouses) + 1
-        people_width = num_people * self.NODE_WIDTH + (num_people - 1) * self.HORIZONTAL_SPACING
-
-        # Get subtree width
-        total_width = subtree_widths.get(person_id, people_width)
-
-        # Center this person (and spouses) within their subtree width
-        people_start_x = x_offset + (total_width - people_width) // 2
-
-        # Position this person
-        positions[person_id] = (people_start_x, y_pos)
-
-        # Position spouse(s) to the right
-        current_x = people_start_x + self.NODE_WIDTH + self.HORIZONTAL_SPACING
-        for spouse_id in spouses:
-            if spouse_id not in processed and spouse_id in tree_structure:
-                positions[spouse_id] = (current_x, y_pos)
-                processed.add(spouse_id)
-                current_x += self.NODE_WIDTH + self.HORIZONTAL_SPACING
-
-        # Layout children below
-        children = data.get('children', [])
-        if children:
-            # Calculate y position for children
-            child_y = y_pos + self.VERTICAL_SPACING + self.IMAGE_HEIGHT
-
-            # Position children left-to-right, centered under parents
-            child_x_offset = x_offset
-
-            for child_id in children:
-                if child_id in tree_structure and child_id not in processed:
-                    child_width = subtree_widths.get(
-                        child_id,
-                        self.NODE_WIDTH + self.HORIZONTAL_SPACING
-                    )
-
-                    self._layout_person_and_descendants(
-                        child_id,
-                        tree_structure,
-                        positions,
-                        processed,
-                        subtree_widths,
-                        child_x_offset,
-                        child_y
-                    )
-
-                    child_x_offset += child_width
-
-    def _create_canvas_elements(self, positions: Dict[str, Tuple[int, int]], tree_structure: Dict[str, Dict]):
+    def _create_canvas_elements(self, positions: Dict[str, Tuple[int, int]], tree_structure: Dict[str, _TreeEntry],
+                                offset_x: int = 0):
         """
         Create canvas nodes and edges from positioned tree structure.
+
+        ``offset_x`` is added to every x position as the nodes are created.
         """
         node_ids = {}  # Map person_id -> canvas node_id
 
         # Create nodes
         for person_id, (x, y) in positions.items():
-            individual = tree_structure[person_id]['individual']
-            node_id = self._create_node(individual, x, y)
-            node_ids[person_id] = node_id
+            node_ids[person_id] = self._create_node(person_id, x + offset_x, y)
 
-        # Create edges
+        # Collect edges, then add each kind in one batch
+        child_links = []
+        spouse_links = []
+        linked_couples = set()  # frozenset({a, b}) for each spouse edge already emitted
         for person_id, data in tree_structure.items():
             from_node_id = node_ids.get(person_id)
             if not from_node_id:
                 continue
 
             # Create parent-child edges
-            for child_id in data['children']:
+            for child_id in data.children:
                 to_node_id = node_ids.get(child_id)
                 if to_node_id:
-                    self._create_edge(from_node_id, to_node_id, "Child", "left", "right")
+                    child_links.append((from_node_id, to_node_id))
 
             # Create spouse edges
-            for spouse_id in data['spouses']:
+            for spouse_id in data.spouses:
                 to_node_id = node_ids.get(spouse_id)
                 if to_node_id:
-                    # Only create edge once (from lower ID to higher ID to avoid duplicates)
-                    if person_id < spouse_id:
-                        self._create_edge(from_node_id, to_node_id, "Spouse", "bottom", "top", bidirectional=True)
+                    # Only create one edge per couple, whichever partner is seen first
+                    couple = frozenset((person_id, spouse_id))
+                    if couple not in linked_couples:
+                        linked_couples.add(couple)
+                        spouse_links.append((from_node_id, to_node_id))
 
-    def _add_disconnected_trees(self, main_tree: Dict[str, Dict]):
+        self._create_edges(child_links, "Child", "left", "right")
+        self._create_edges(spouse_links, "Spouse", "bottom", "top", bidirectional=True)
+
+    def _connected_components(self, person_ids: Set[str]) -> List[List[str]]:
+        """
+        Partition people into groups linked by any parent, spouse or child relation.
+
+        Uses a single union-find pass over the adjacency lists, treating every
+        link as undirected. Groups and their members follow individual order.
+        """
+        parent = {pid: pid for pid in person_ids}
+
+        def find(pid: str) -> str:
+            while parent[pid] != pid:
+                parent[pid] = parent[parent[pid]]
+                pid = parent[pid]
+            return pid
+
+        for pid in person_ids:
+            for relatives in (self._parents_of[pid], self._spouses_of[pid], self._children_of[pid]):
+                for other in relatives:
+                    if other in parent:
+                        root_a, root_b = find(pid), find(other)
+                        if root_a != root_b:
+                            parent[root_b] = root_a
+
+        groups: Dict[str, List[str]] = {}
+        for pid in self.individual_map:
+            if pid in parent:
+                groups.setdefault(find(pid), []).append(pid)
+        return list(groups.values())
+
+    def _add_disconnected_trees(self, main_tree: Dict[str, _TreeEntry]):
         """
         Find individuals not in main tree and create separate tree groups.
         """
-        connected_ids = set(main_tree.keys())
-        disconnected_ids = set(self.individual_map.keys()) - connected_ids
+        disconnected_ids = self.individual_map.keys() - main_tree.keys()
 
         if not disconnected_ids:
             logger.info("No disconnected family trees found")
@@ -1054,81 +973,67 @@ class CanvasGenerator:
 
         logger.info(f"Found {len(disconnected_ids)} people in disconnected trees")
 
-        # Find separate tree roots (people with no parents in the disconnected set)
-        tree_roots = []
-
-        for person_id in disconnected_ids:
-            individual = self.individual_map[person_id]
-            families_as_child = individual.get_families_as_child()
-
-            has_parent_in_disconnected = False
-            for family in families_as_child:
-                father_id = family.get('father')
-                mother_id = family.get('mother')
-                if (father_id and father_id in disconnected_ids) or (mother_id and mother_id in disconnected_ids):
-                    has_parent_in_disconnected = True
-                    break
-
-            if not has_parent_in_disconnected:
-                tree_roots.append(person_id)
-
-        logger.info(f"Found {len(tree_roots)} disconnected tree roots")
+        components = self._connected_components(disconnected_ids)
+        logger.info(f"Found {len(components)} disconnected family groups")
 
         # Calculate offset for disconnected trees
         # Place them to the right of the main tree
-        if self.nodes:
-            max_x = max(node['x'] + node['width'] for node in self.nodes)
-            offset_x = max_x + self.TREE_SPACING
+        if self._node_ids:
+            offset_x = self._max_x + self.TREE_SPACING
         else:
             offset_x = 0
 
-        # Build and position each disconnected tree
-        for root_id in tree_roots:
-            if root_id not in disconnected_ids:
-                continue  # Already processed
-
-            # Build tree structure for this root
-            tree_structure = self._build_tree_structure(root_id)
-            logger.info(f"  Disconnected tree from {root_id}: {len(tree_structure)} people")
-
-            # Update disconnected_ids to track what we've processed
-            disconnected_ids -= set(tree_structure.keys())
-
-            # Calculate positions
-            positions = self._calculate_positions(tree_structure)
-
-            # Offset positions
-            offset_positions = {
-                pid: (x + offset_x, y) for pid, (x, y) in positions.items()
-            }
-
-            # Create nodes and edges
-            self._create_canvas_elements(offset_positions, tree_structure)
+        for component in components:
+            # Usually one BFS covers the whole group; more are only needed when
+            # relationships are recorded on one side only
+            pending = set(component)
+            while pending:
+                # Start from someone with no parents in the group (a tree root)
+                root_id = next(
+                    (pid for pid in component if pid in pending and pending.isdisjoint(self._parents_of[pid])),
+                    next(pid for pid in component if pid in pending)
+                )
+
+                # Build tree structure for this root
+                tree_structure = self._build_tree_structure(root_id, within=pending)
+                logger.info("  Disconnected tree from %s: %s people", root_id, len(tree_structure))
+                pending.difference_update(tree_structure)
+
+                # Calculate positions
+                positions = self._calculate_positions(tree_structure)
+
+                # Create nodes and edges
+                self._create_canvas_elements(positions, tree_structure, offset_x)
+
+                # Update offset for next tree (it was placed right of everything else)
+                if positions:
+                    offset_x = self._max_x + self.TREE_SPACING
+
+    @staticmethod
+    def _birth_year(individual: Individual) -> str:
+        """
+        Get the four-digit birth year used in an individual's note filename.
 
-            # Update offset for next tree
-            if offset_positions:
-                max_x_in_tree = max(x + self.NODE_WIDTH for x, y in offset_positions.values())
-                offset_x = max_x_in_tree + self.TREE_SPACING
+        Same logic as in the markdown generator; returns "" if unknown.
+        """
+        for event in individual.get_events():
+            if event["type"] == "BIRT" and event.get("date"):
+                year_match = _YEAR_RE.search(event["date"])
+                if year_match:
+                    return year_match.group(1)
+        return ""
 
-    def _create_node(self, individual: Individual, x: int, y: int) -> str:
+    def _create_node(self, person_id: str, x: int, y: int) -> str:
         """
         Create a canvas node for an individual.
 
         Returns the node ID.
         """
-        node_id = str(uuid.uuid4().hex[:16])
-        first_name, last_name = individual.get_names()
-
-        # Get filename (same logic as in markdown generator)
-        birth_year = ""
-        events = individual.get_events()
-        for event in events:
-            if event["type"] == "BIRT" and event.get("date"):
-                import re
-                year_match = re.search(r'\b(\d{4})\b', event["date"])
-                if year_match:
-                    birth_year = year_match.group(1)
-                    break
+        node_id = f"{self._next_id:016x}"
+        self._next_id += 1
+        meta = self._meta[person_id]
+        first_name, last_name = meta['names']
+        birth_year = meta['birth_year']
 
         # Build filename for WikiLink
         filename_parts = []
@@ -1141,84 +1046,136 @@ class CanvasGenerator:
         filename = " ".join(filename_parts)
 
         # Get images
-        images = individual.get_images()
+        images = meta['images']
         has_image = len(images) > 0
 
-        # Build node text content
-        text_parts = []
-
-        # Add image if available (use first image)
-        if has_image:
-            # images is a list of dicts with 'file', 'title', 'format' keys
-            image_file = images[0].get('file', '')
-            if image_file:
-                text_parts.append(f"![Image]({image_file})")
-
-        # Add WikiLink to person's markdown file
-        text_parts.append(f"[[{filename}]]")
-
-        node_text = "\n".join(text_parts)
+        # Build node text content: optional first image, then WikiLink to person's markdown file
+        # images is a list of dicts with 'file', 'title', 'format' keys
+        image_file = images[0].get('file', '') if has_image else ''
+        if image_file:
+            node_text = f"![Image]({image_file})\n[[{filename}]]"
+        else:
+            node_text = f"[[{filename}]]"
 
         # Calculate height based on content
         height = self.IMAGE_HEIGHT if has_image else self.NODE_BASE_HEIGHT
 
-        node = {
-            "id": node_id,
-            "type": "text",
-            "text": node_text,
-            "x": x,
-            "y": y,
-            "width": self.NODE_WIDTH,
-            "height": height
-        }
-
-        self.nodes.append(node)
+        self._node_ids.append(node_id)
+        self._node_text.append(node_text)
+        self._node_x.append(x)
+        self._node_y.append(y)
+        self._node_height.append(height)
+        if x + self.NODE_WIDTH > self._max_x:
+            self._max_x = x + self.NODE_WIDTH
         return node_id
 
-    def _create_edge(self, from_node: str, to_node: str, label: str = "",
-                     from_side: str = "bottom", to_side: str = "top",
-                     bidirectional: bool = False):
+    def _create_edges(self, links: List[Tuple[str, str]], label: str = "",
+                      from_side: str = "bottom", to_side: str = "top",
+                      bidirectional: bool = False):
         """
-        Create a canvas edge between two nodes.
+        Create canvas edges that share the same label and styling.
 
         Args:
-            from_node: Source node ID
-            to_node: Target node ID
+            links: (from_node, to_node) node ID pairs
             label: Edge label (optional)
             from_side: Which side of source node to connect from
             to_side: Which side of target node to connect to
             bidirectional: If True, adds arrow on fromEnd to make it bidirectional
         """
-        edge_id = str(uuid.uuid4().hex[:16])
-
-        edge = {
-            "id": edge_id,
-            "fromNode": from_node,
-            "fromSide": from_side,
-            "toNode": to_node,
-            "toSide": to_side
-        }
+        count = len(links)
+        if not count:
+            return
 
-        # Add label only if provided
-        if label:
-            edge["label"] = label
+        first_id = self._next_id
+        self._next_id += count
+        self._edge_ids.extend(f"{edge_id:016x}" for edge_id in range(first_id, first_id + count))
+        self._edge_from.extend(from_node for from_node, _ in links)
+        self._edge_from_side.extend([from_side] * count)
+        self._edge_to.extend(to_node for _, to_node in links)
+        self._edge_to_side.extend([to_side] * count)
+        self._edge_label.extend([label] * count)
+        self._edge_bidirectional.extend([bidirectional] * count)
+
+    def _iter_nodes(self) -> Iterator[Dict]:
+        """Yield one JSON Canvas node dict per stored node."""
+        # Copying a pre-keyed template is cheaper than building each dict from scratch
+        template = {
+            "id": None,
+            "type": "text",
+            "text": None,
+            "x": 0,
+            "y": 0,
+            "width": self.NODE_WIDTH,
+            "height": 0
+        }
+        for node_id, text, x, y, height in zip(
+            self._node_ids, self._node_text, self._node_x, self._node_y, self._node_height
+        ):
+            node = template.copy()
+            node["id"] = node_id
+            node["text"] = text
+            node["x"] = x
+            node["y"] = y
+            node["height"] = height
+            yield node
+
+    def _iter_edges(self) -> Iterator[Dict]:
+        """Yield one JSON Canvas edge dict per stored edge."""
+        template = dict.fromkeys(("id", "fromNode", "fromSide", "toNode", "toSide"))
+        for edge_id, from_node, from_side, to_node, to_side, label, bidirectional in zip(
+            self._edge_ids, self._edge_from, self._edge_from_side,
+            self._edge_to, self._edge_to_side, self._edge_label, self._edge_bidirectional
+        ):
+            edge = template.copy()
+            edge["id"] = edge_id
+            edge["fromNode"] = from_node
+            edge["fromSide"] = from_side
+            edge["toNode"] = to_node
+            edge["toSide"] = to_side
+
+            # Add label only if provided
+            if label:
+                edge["label"] = label
+
+            # Add bidirectional arrow if requested
+            if bidirectional:
+                edge["fromEnd"] = "arrow"
+
+            yield edge
+
+    @staticmethod
+    def _write_records(f, records: Iterator[Dict]):
+        """Write compact JSON records to a binary file, separated by ",\\n"."""
+        # Pick the encoder once; availability of orjson can't change mid-write
+        if orjson is not None:
+            encode = orjson.dumps
+        else:
+            encode_text = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
 
-        # Add bidirectional arrow if requested
-        if bidirectional:
-            edge["fromEnd"] = "arrow"
+            def encode(record: Dict) -> bytes:
+                return encode_text(record).encode('utf-8')
 
-        self.edges.append(edge)
+        write = f.write
+        prefix = b'\t\t'
+        for record in records:
+            write(prefix + encode(record))
+            prefix = b',\n\t\t'
 
     def _write_canvas_file(self, canvas_path: str):
         """
         Write canvas data to JSON file.
-        """
-        canvas_data = {
-            "nodes": self.nodes,
-            "edges": self.edges
-        }
 
-        with open(canvas_path, 'w', encoding='utf-8') as f:
-            json.dump(canvas_data, f, indent="\t")
+        Records are serialized and written one at a time, one per line (the
+        same layout Obsidian uses), so the full document is never held in
+        memory. Uses orjson when it is installed and falls back to the
+        standard library otherwise; both produce identical bytes.
+        """
+        # A large buffer keeps the many small record writes from each hitting the OS
+        with open(canvas_path, 'wb', buffering=1 << 20) as f:
+            f.write(b'{\n\t"nodes":[\n')
+            self._write_records(f, self._iter_nodes())
+            f.write(b'\n\t],\n\t"edges":[\n')
+            self._write_records(f, self._iter_edges())
+            f.write(b'\n\t]\n}\n')
 
         logger.info(f"Canvas file written to: {canvas_path}")
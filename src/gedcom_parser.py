@@ -6,8 +6,10 @@ individual and family data.
 """
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import logging
+import os
+import tempfile
 
 from gedcom.parser import Parser
 from gedcom.element.individual import IndividualElement
@@ -40,66 +42,88 @@ class GedcomParser:
 
         self.file_path = file_path
 
-        # Check and fix line endings if needed
-        self._fix_line_endings_if_needed()
-
         self.parser = Parser()
+        self._individuals = None
+
+        # Check line endings; CR-only files are parsed from a fixed copy
+        fixed_path = self._fix_line_endings_if_needed()
 
         try:
             logger.info(f"Parsing GEDCOM file: {file_path}")
-            self.parser.parse_file(str(file_path))
+            self.parser.parse_file(str(fixed_path or file_path))
         except Exception as e:
             raise ValueError(f"Failed to parse GEDCOM file: {e}") from e
-
-    def _fix_line_endings_if_needed(self):
+        finally:
+            if fixed_path is not None:
+                try:
+                    os.unlink(fixed_path)
+                except OSError as e:
+                    logger.warning(f"Could not remove temporary file {fixed_path}: {e}")
+
+    def _fix_line_endings_if_needed(self) -> Optional[str]:
         """
         Convert CR-only (old Mac) line endings in the GEDCOM file to LF if detected.
-        
-        If the file is found to use CR-only line endings, this method replaces CR with LF in-place on disk and logs a warning before the change and an informational message after successful rewriting.
+
+        The input file is never modified. If the file is found to use CR-only
+        line endings, a converted copy is written to a temporary file for the
+        parser (python-gedcom can only parse from a path) and a warning is
+        logged. Files that already use LF or CRLF are only sampled, not read
+        in full.
+
+        Returns:
+            Optional[str]: Path of the temporary converted copy, which the
+            caller must delete, or `None` if no conversion was needed.
         """
-        # Read first chunk to check line endings
         with open(self.file_path, "rb") as f:
+            # Read first chunk to check line endings
             sample = f.read(8192)  # Read first 8KB
 
-        # Count different line ending types
-        has_crlf = b"\r\n" in sample
-        has_lf = b"\n" in sample
-        has_cr = b"\r" in sample
+            # Count different line ending types
+            has_crlf = b"\r\n" in sample
+            has_lf = b"\n" in sample
+            has_cr = b"\r" in sample
+
+            # If we have CR but no LF, this is a CR-only file
+            if not has_cr or has_lf or has_crlf:
+                return None
 
-        # If we have CR but no LF, this is a CR-only file
-        if has_cr and not has_lf and not has_crlf:
             logger.warning(
                 "Detected old Mac-style (CR-only) line endings in GEDCOM file. "
                 "Converting to Unix-style (LF) line endings..."
             )
 
-            # Read entire file and fix line endings
-            with open(self.file_path, "rb") as f:
-                content = f.read()
-
-            # Replace CR with LF
-            fixed_content = content.replace(b"\r", b"\n")
+            # Read the rest from the same handle and replace CR with LF
+            fixed_content = (sample + f.read()).replace(b"\r", b"\n")
 
-            # Write back to file
-            with open(self.file_path, "wb") as f:
+        fd, fixed_path = tempfile.mkstemp(suffix=".ged")
+        try:
+            with os.fdopen(fd, "wb") as f:
                 f.write(fixed_content)
+        except BaseException:
+            # Don't leave a partial copy behind in the temp directory
+            os.unlink(fixed_path)
+            raise
 
-            logger.info("Line endings fixed successfully")
+        logger.info(f"Parsing a normalized temporary copy; {self.file_path} is unchanged")
+        return fixed_path
 
     def get_individuals(self) -> List[IndividualElement]:
         """
         Return all IndividualElement objects extracted from the parsed GEDCOM file.
-        
+
+        The root elements are scanned on the first call only; later calls return
+        the same list, so callers must not modify it.
+
         Returns:
             List[IndividualElement]: A list of individuals found in the GEDCOM root elements.
         """
-        individuals = []
-        for element in self.parser.get_root_child_elements():
-            if isinstance(element, IndividualElement):
-                individuals.append(element)
-
-        logger.info(f"Found {len(individuals)} individuals")
-        return individuals
+        if self._individuals is None:
+            self._individuals = [
+                element for element in self.parser.get_root_child_elements()
+                if isinstance(element, IndividualElement)
+            ]
+            logger.info(f"Found {len(self._individuals)} individuals")
+        return self._individuals
 
     def get_element_by_pointer(self, pointer: str):
         """
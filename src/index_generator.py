@@ -5,6 +5,7 @@ This module generates an alphabetical index of all individuals in the
 family tree.
 """
 
+from operator import itemgetter
 from pathlib import Path
 from typing import List
 import logging
@@ -15,6 +16,20 @@ from individual import Individual
 
 logger = logging.getLogger(__name__)
 
+# Four-digit death year inside a GEDCOM date ("1850", "15 JUN 1850")
+_DEATH_YEAR_RE = re.compile(r"(\d{4})\b")
+
+
+def _index_sort_key(first: str, last: str) -> str:
+    """
+    Return the case-insensitive last-name-then-first-name sort key.
+
+    The names are joined with a NUL separator, which sorts before every other
+    character. Comparing the single string therefore orders exactly like the
+    (last, first) tuple, with one string comparison instead of a tuple walk.
+    """
+    return f"{last.lower()}\x00{first.lower()}"
+
 
 class IndexGenerator:
     """
@@ -55,61 +70,69 @@ class IndexGenerator:
 
         logger.info(f"Generating index file: {index_filename}")
 
-        # Sort individuals by last name, then first name
-        sorted_individuals = sorted(
-            individuals,
-            key=lambda i: (i.get_names()[1].lower(), i.get_names()[0].lower()),
-        )
-
+        # Reduce each individual to the three fields the index needs in one
+        # pass, so sorting and writing only touch flat (key, letter, line) rows
+        rows = []
+        for individual in individuals:
+            first, last = individual.get_names()
+
+            # Use "#" for individuals without last name
+            letter = last[0].upper() if last else "#"
+
+            # Use mapped filename if available, otherwise use base filename
+            individual_id = individual.get_id()
+            if individual_id in self.filename_map:
+                filename = self.filename_map[individual_id]
+            else:
+                filename = individual.get_file_name()
+
+            birth_info = individual.get_birth_info()
+            death_info = individual.get_death_info()
+
+            # Format life span
+            if birth_info["year"] or death_info["date"]:
+                death_year = ""
+                death_date = death_info["date"]
+                if len(death_date) == 4 and death_date.isdecimal():
+                    # Bare year ("1850"): no regex needed
+                    death_year = death_date
+                elif death_date:
+                    match = _DEATH_YEAR_RE.search(death_date)
+                    if match:
+                        death_year = match.group(1)
+                life_span = f" ({birth_info['year']}-{death_year})"
+            else:
+                life_span = ""
+
+            # Create WikiLink with path prefix if using subdirectories
+            if self.people_subdir:
+                wiki_link = f"[[{self.people_subdir}/{filename}|{individual.get_full_name()}]]"
+            else:
+                wiki_link = f"[[{filename}]]"
+
+            rows.append((_index_sort_key(first, last), letter, f"- {wiki_link}{life_span}\n"))
+
+        # Sort by last name, then first name (stable for equal names)
+        rows.sort(key=itemgetter(0))
+
+        # Collect the document's pieces, then hand them to one buffered write pass
+        parts = ["# Family Tree Index\n\n", f"Total individuals: {len(individuals)}\n\n"]
+
+        # Group by last name initial
+        current_letter = ""
+
+        for _key, letter, line in rows:
+            # Write letter header if changed
+            if letter != current_letter:
+                current_letter = letter
+                parts.append(f"\n## {current_letter}\n\n")
+
+            parts.append(line)
+
+        # writelines streams the pieces through the file buffer, so no joined
+        # copy of the whole document is ever built
         with open(index_path, "w", encoding="utf-8") as f:
-            f.write("# Family Tree Index\n\n")
-            f.write(f"Total individuals: {len(individuals)}\n\n")
-
-            # Group by last name initial
-            current_letter = ""
-
-            for individual in sorted_individuals:
-                _, last = individual.get_names()
-
-                # Write letter header if changed
-                if last:
-                    letter = last[0].upper()
-                else:
-                    letter = "#"  # For individuals without last name
-
-                if letter != current_letter:
-                    current_letter = letter
-                    f.write(f"\n## {current_letter}\n\n")
-
-                # Write individual link with life span
-                # Use mapped filename if available, otherwise use base filename
-                individual_id = individual.get_id()
-                if individual_id in self.filename_map:
-                    filename = self.filename_map[individual_id]
-                else:
-                    filename = individual.get_file_name()
-
-                birth_info = individual.get_birth_info()
-                death_info = individual.get_death_info()
-
-                # Format life span
-                if birth_info["year"] or death_info["date"]:
-                    death_year = ""
-                    if death_info["date"]:
-                        match = re.search(r"(\d{4})\b", death_info["date"])
-                        if match:
-                            death_year = match.group(1)
-                    life_span = f" ({birth_info['year']}-{death_year})"
-                else:
-                    life_span = ""
-
-                # Create WikiLink with path prefix if using subdirectories
-                if self.people_subdir:
-                    wiki_link = f"[[{self.people_subdir}/{filename}|{individual.get_full_name()}]]"
-                else:
-                    wiki_link = f"[[{filename}]]"
-
-                f.write(f"- {wiki_link}{life_span}\n")
+            f.writelines(parts)
 
         logger.info(f"Index generated with {len(individuals)} individuals")
         return index_path
\ No newline at end of file
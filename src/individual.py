@@ -5,9 +5,10 @@ This module provides a rich data model for individuals in a family tree,
 extracting all relevant information from GEDCOM data.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import logging
 import re
+import weakref
 
 from gedcom.element.individual import IndividualElement
 import gedcom.tags
@@ -15,6 +16,184 @@ import gedcom.tags
 
 logger = logging.getLogger(__name__)
 
+# Four-digit year inside a GEDCOM date ("1850", "ABT 1850", "1 JAN 1850")
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+
+# Event tags collected by get_events()
+_EVENT_TAGS = frozenset(("BIRT", "DEAT", "MARR", "OCCU", "EDUC", "RESI", "BURI"))
+
+# Physical attribute tags collected by get_attributes()
+_ATTRIBUTE_TAGS = frozenset(("EYES", "HAIR", "HEIG"))
+
+# Sub-record tag -> dict key, for event details and media records
+_EVENT_FIELDS = {"DATE": "date", "PLAC": "place"}
+_IMAGE_FIELDS = {"FILE": "file", "TITL": "title", "FORM": "format"}
+
+# Tags that continue the text of the record above them
+_CONTINUATION_TAGS = frozenset(("CONT", "CONC"))
+
+# Bound once so relationship loops don't re-resolve gedcom.tags attributes
+_TAG_FAMILY = gedcom.tags.GEDCOM_TAG_FAMILY
+_TAG_CHILD = gedcom.tags.GEDCOM_TAG_CHILD
+_TAG_HUSBAND = gedcom.tags.GEDCOM_TAG_HUSBAND
+_TAG_WIFE = gedcom.tags.GEDCOM_TAG_WIFE
+_TAG_MARRIAGE = gedcom.tags.GEDCOM_TAG_MARRIAGE
+_TAG_DATE = gedcom.tags.GEDCOM_TAG_DATE
+_TAG_PLACE = gedcom.tags.GEDCOM_TAG_PLACE
+
+# Per-parser caches. Each entry is stored as (element dictionary, value) and
+# only reused while the parser still returns that same dictionary object:
+# parse_file() and invalidate_cache() make python-gedcom build a new one, so
+# re-parsing a Parser drops everything derived from the previous parse.
+
+# Per-parser registry of live wrappers (pointer -> Individual), see Individual.for_element
+_wrappers_cache = weakref.WeakKeyDictionary()
+
+# Per-parser index: child pointer -> [(father pointer, mother pointer), ...]
+_parents_by_child_cache = weakref.WeakKeyDictionary()
+
+# Per-parser index: family pointer -> summary dict, see _family_summaries
+_family_summaries_cache = weakref.WeakKeyDictionary()
+
+
+def _cached_for_parse(cache, parser):
+    """
+    Return the value cached for the parser's current parse, or None.
+
+    An entry made before the parser re-parsed (or had its cache invalidated)
+    is discarded.
+    """
+    entry = cache.get(parser)
+    if entry is None:
+        return None
+    if entry[0] is not parser.get_element_dictionary():
+        del cache[parser]
+        return None
+    return entry[1]
+
+
+def _parents_by_child(parser) -> Dict[str, List[Tuple[Optional[str], Optional[str]]]]:
+    """
+    Map every child pointer to the (father, mother) pointers of each family it belongs to.
+
+    Built from _family_summaries the first time it is needed, then cached until
+    the parser re-parses.
+    """
+    index = _cached_for_parse(_parents_by_child_cache, parser)
+    if index is not None:
+        return index
+
+    index = {}
+    for summary in _family_summaries(parser).values():
+        father_id = None
+        mother_id = None
+
+        for parent in summary["parents"]:
+            # Determine gender to assign father/mother
+            # Check gender tag
+            gender = None
+            for child_elem in parent.get_child_elements():
+                if child_elem.get_tag() == "SEX":
+                    gender = child_elem.get_value()
+                    break
+
+            if gender == "M":
+                father_id = parent.get_pointer()
+            elif gender == "F":
+                mother_id = parent.get_pointer()
+            else:
+                # If no gender specified, assign to father if empty, else mother
+                if not father_id:
+                    father_id = parent.get_pointer()
+                elif not mother_id:
+                    mother_id = parent.get_pointer()
+
+        for child in summary["children"]:
+            index.setdefault(child.get_pointer(), []).append((father_id, mother_id))
+
+    _parents_by_child_cache[parser] = (parser.get_element_dictionary(), index)
+    return index
+
+
+def _family_summaries(parser) -> Dict[str, Dict]:
+    """
+    Map every family pointer to its members and marriage details.
+
+    This is the one place family membership is read from the GEDCOM records;
+    the relationship getters and _parents_by_child all use it. Each summary
+    holds 'parents' and 'children' (resolved elements, in file order; a child
+    listed twice appears once) and 'marriage_date' / 'marriage_place'. Built
+    with one pass over the parser's family records the first time it is
+    needed, so a family is read once rather than once per spouse, then
+    cached until the parser re-parses.
+    """
+    summaries = _cached_for_parse(_family_summaries_cache, parser)
+    if summaries is not None:
+        return summaries
+
+    summaries = {}
+    element_dictionary = parser.get_element_dictionary()
+    for family in parser.get_root_child_elements():
+        if family.get_tag() != _TAG_FAMILY:
+            continue
+
+        parents = []
+        children = {}  # Pointer -> element; drops repeated CHIL records
+        marriage_date = ""
+        marriage_place = ""
+
+        for child in family.get_child_elements():
+            tag = child.get_tag()
+
+            if tag == _TAG_HUSBAND or tag == _TAG_WIFE:
+                parent = element_dictionary.get(child.get_value())
+                if parent is not None:
+                    parents.append(parent)
+            elif tag == _TAG_CHILD:
+                child_element = element_dictionary.get(child.get_value())
+                if child_element is not None:
+                    children.setdefault(child.get_value(), child_element)
+            elif tag == _TAG_MARRIAGE:
+                for subchild in child.get_child_elements():
+                    subtag = subchild.get_tag()
+                    if subtag == _TAG_DATE:
+                        marriage_date = subchild.get_value()
+                    elif subtag == _TAG_PLACE:
+                        marriage_place = subchild.get_value()
+
+        summaries[family.get_pointer()] = {
+            "parents": parents,
+            "children": list(children.values()),
+            "marriage_date": marriage_date,
+            "marriage_place": marriage_place,
+        }
+
+    _family_summaries_cache[parser] = (element_dictionary, summaries)
+    return summaries
+
+
+def _resolve_obje(reference: Optional[str], element_dictionary: Dict) -> Optional[Dict[str, str]]:
+    """
+    Resolve an OBJE pointer to its file, title and format.
+
+    Returns None when the value is not a pointer, the record is missing, or it
+    has no FILE value.
+    """
+    if not reference or not reference.startswith("@"):
+        return None
+
+    obje_element = element_dictionary.get(reference)
+    if not obje_element:
+        return None
+
+    image_info = {"file": "", "title": "", "format": ""}
+    for obje_child in obje_element.get_child_elements():
+        field = _IMAGE_FIELDS.get(obje_child.get_tag())
+        if field:
+            image_info[field] = obje_child.get_value() or ""
+
+    return image_info if image_info["file"] else None
+
 
 class Individual:
     """
@@ -25,6 +204,14 @@ class Individual:
     images, and notes.
     """
 
+    # No per-instance __dict__: large trees hold one wrapper per person.
+    # __weakref__ keeps the wrappers usable in the for_element registry.
+    __slots__ = (
+        'element', 'gedcom', '_id', '_names', '_full_name', '_file_name',
+        '_birth_info', '_death_info', '_events', '_images', '_families',
+        '_spouse_families', '_children_by_tag', '__weakref__',
+    )
+
     def __init__(self, element: IndividualElement, parser):
         """
         Create an Individual wrapper around a GEDCOM individual element and parser.
@@ -37,15 +224,62 @@ class Individual:
         """
         self.element = element
         self.gedcom = parser
+        self._id = None  # Cached result of get_id()
+        self._names = None  # Cached result of get_names()
+        self._full_name = None  # Cached result of get_full_name()
+        self._file_name = None  # Cached result of get_file_name()
+        self._birth_info = None  # Cached result of get_birth_info()
+        self._death_info = None  # Cached result of get_death_info()
+        self._events = None  # Cached result of get_events()
+        self._images = None  # Cached result of get_images()
+        self._families = None  # Cached result of get_families()
+        self._spouse_families = None  # Cached FAMS family records
+        self._children_by_tag = None  # Cached tag -> child records index
+
+    @classmethod
+    def for_element(cls, element: IndividualElement, parser) -> "Individual":
+        """
+        Return the shared wrapper for a GEDCOM individual element.
+
+        Every lookup of the same person through the same parser yields the same
+        Individual while it is in use, so cached data is computed once per
+        person rather than once per wrapper. Wrappers are held weakly and
+        disappear with their last reference.
+
+        Parameters:
+            element (IndividualElement): The GEDCOM individual element to wrap.
+            parser: The parser instance used for resolving references.
+
+        Returns:
+            Individual: The existing wrapper for this element, or a new one.
+        """
+        pointer = element.get_pointer()
+        if not pointer:
+            return cls(element, parser)
+
+        wrappers = _cached_for_parse(_wrappers_cache, parser)
+        if wrappers is None:
+            wrappers = weakref.WeakValueDictionary()
+            _wrappers_cache[parser] = (parser.get_element_dictionary(), wrappers)
+
+        individual = wrappers.get(pointer)
+        if individual is None:
+            individual = cls(element, parser)
+            wrappers[pointer] = individual
+        return individual
 
     def get_id(self) -> str:
         """
         Provide the GEDCOM identifier for this individual without surrounding '@' characters.
 
+        The identifier is computed on first use and cached.
+
         Returns:
             str: The GEDCOM identifier with all '@' characters removed.
         """
-        return self.element.get_pointer().replace('@', '')
+        if self._id is None:
+            self._id = self.element.get_pointer().replace('@', '')
+        return self._id
 
     def get_pointer(self) -> str:
         """
@@ -59,30 +293,44 @@ class Individual:
     def get_names(self) -> Tuple[str, str]:
         """
         Return the individual's first and last name with surrounding whitespace removed.
-        
+
+        The NAME record is parsed on the first call only; sorting, file naming
+        and link rendering all ask for the names repeatedly.
+
         Returns:
             tuple(first_name, last_name): The person's given name and family name, both trimmed of leading and trailing whitespace.
         """
-        first, last = self.element.get_name()
-        return first.strip(), last.strip()
+        if self._names is None:
+            first, last = self.element.get_name()
+            self._names = (first.strip(), last.strip())
+        return self._names
 
     def get_full_name(self) -> str:
         """
         Return the individual's full name formatted as "First Last".
 
+        The result is computed on first use and cached.
+
         Returns:
             Full name string preserving original capitalization; empty string if no name parts exist.
         """
-        first, last = self.get_names()
-        return f"{first} {last}".strip()
+        if self._full_name is None:
+            first, last = self.get_names()
+            self._full_name = f"{first} {last}".strip()
+        return self._full_name
 
     def get_file_name(self) -> str:
         """
         Build a filename-like string for the individual in the form "FamilyName FirstName BirthYear".
 
+        The result is computed on first use and cached.
+
         Returns:
             filename (str): The generated filename string "FamilyName FirstName BirthYear" (or without year if unavailable); does not include a file extension; preserves original name capitalization.
         """
+        if self._file_name is not None:
+            return self._file_name
+
         first, last = self.get_names()
         birth_info = self.get_birth_info()
         birth_year = birth_info.get('year', '')
@@ -96,48 +344,64 @@ class Individual:
         if birth_year:
             parts.append(birth_year)
 
-        return " ".join(parts)
+        self._file_name = " ".join(parts)
+        return self._file_name
 
     def get_birth_info(self) -> Dict[str, str]:
         """
         Retrieve the person's birth date, place, and year from the underlying GEDCOM element.
 
+        The dictionary is built on first use and cached; callers must not modify it.
+
         Returns:
             dict: A dictionary with keys:
                 - 'date' (str): Birth date string or '' if unavailable.
                 - 'place' (str): Birth place string or '' if unavailable.
                 - 'year' (str): Birth year as a string or '' if the year is unknown.
         """
+        if self._birth_info is not None:
+            return self._birth_info
+
         date, place, _sources = self.element.get_birth_data()
-        year = self.element.get_birth_year()
+        year_match = _YEAR_RE.search(date or "")
 
-        return {
+        self._birth_info = {
             "date": date or "",
             "place": place or "",
-            "year": str(year) if year != -1 else "",
+            "year": year_match.group(1) if year_match else "",
         }
+        return self._birth_info
 
     def get_death_info(self) -> Dict[str, str]:
         """
         Provide the individual's death date, place, and year.
 
+        The dictionary is built on first use and cached; callers must not modify it.
+
         Returns:
             dict: Dictionary with keys:
                 - date (str): Death date as a string, or '' if unknown.
                 - place (str): Death place as a string, or '' if unknown.
                 - year (str): Death year extracted from date, or '' if unavailable.
         """
+        if self._death_info is not None:
+            return self._death_info
+
         date, place, _sources = self.element.get_death_data()
 
         # Extract year from date string using regex
         # Handles formats like "1850", "ABT 1850", "1 JAN 1850", "JAN 1850"
         year = ""
-        if date:
-            year_match = re.search(r'\b(\d{4})\b', date)
+        if len(date or "") == 4 and date.isdecimal():
+            # Bare year ("1850"): no regex needed
+            year = date
+        elif date:
+            year_match = _YEAR_RE.search(date)
             if year_match:
                 year = year_match.group(1)
 
-        return {"date": date or "", "place": place or "", "year": year}
+        self._death_info = {"date": date or "", "place": place or "", "year": year}
+        return self._death_info
 
     def get_gender(self) -> str:
         """
@@ -156,7 +420,43 @@ class Individual:
             A list of Individual objects representing the person's parents.
         """
         parent_elements = self.gedcom.get_parents(self.element)
-        return [Individual(p, self.gedcom) for p in parent_elements]
+        return [Individual.for_element(p, self.gedcom) for p in parent_elements]
+
+    def _get_records(self, tag: str) -> list:
+        """
+        Return this person's direct child records with the given tag, in file order.
+
+        The child records are grouped by tag in one pass on first use, so the
+        single-tag getters below don't each walk the whole record list.
+        """
+        if self._children_by_tag is None:
+            children_by_tag = {}
+            for child in self.element.get_child_elements():
+                children_by_tag.setdefault(child.get_tag(), []).append(child)
+            self._children_by_tag = children_by_tag
+        return self._children_by_tag.get(tag, [])
+
+    def _get_spouse_families(self) -> list:
+        """
+        Return the family records this person is a spouse in.
+
+        The references are resolved on first use and cached; callers must not
+        modify the list.
+        """
+        if self._spouse_families is None:
+            self._spouse_families = self.gedcom.get_families(self.element)
+        return self._spouse_families
+
+    def has_families(self) -> bool:
+        """
+        Report whether this person is a spouse in any family.
+
+        Cheaper than testing `get_families()`, which resolves every partner and child.
+
+        Returns:
+            bool: True if at least one FAMS family record resolves.
+        """
+        return bool(self._get_spouse_families())
 
     def get_children(self) -> List["Individual"]:
         """
@@ -166,12 +466,10 @@ class Individual:
             children (List[Individual]): A list of Individual instances corresponding to this person's children.
         """
         children = []
-        for family in self.gedcom.get_families(self.element):
-            child_elements = self.gedcom.get_family_members(
-                family, gedcom.tags.GEDCOM_TAG_CHILD
-            )
-            for child in child_elements:
-                children.append(Individual(child, self.gedcom))
+        summaries = _family_summaries(self.gedcom)
+        for family in self._get_spouse_families():
+            for child in summaries[family.get_pointer()]["children"]:
+                children.append(Individual.for_element(child, self.gedcom))
         return children
 
     def get_partners(self) -> List["Individual"]:
@@ -184,18 +482,24 @@ class Individual:
             List[Individual]: A list of Individual objects representing the person's partners (excluding the subject).
         """
         partners = []
-        for family in self.gedcom.get_families(self.element):
-            parent_elements = self.gedcom.get_family_members(family, "PARENTS")
-            for parent in parent_elements:
+        summaries = _family_summaries(self.gedcom)
+        own_pointer = self.element.get_pointer()
+        for family in self._get_spouse_families():
+            for parent in summaries[family.get_pointer()]["parents"]:
                 # Don't include self
-                if parent.get_pointer() != self.element.get_pointer():
-                    partners.append(Individual(parent, self.gedcom))
+                if parent.get_pointer() != own_pointer:
+                    partners.append(Individual.for_element(parent, self.gedcom))
         return partners
 
     def get_families(self) -> List[Dict]:
         """
         Get all families this person is part of (as spouse).
 
+        Partners, marriage details and children come from a per-parser summary
+        of every family record, so each family is read once rather than once
+        per spouse. The list is built on first use and cached; callers must
+        not modify it.
+
         Returns:
             List of dictionaries with family information including:
             - partner: Individual object
@@ -203,103 +507,62 @@ class Individual:
             - marriage_place: str
             - children: List of Individual objects
         """
+        if self._families is not None:
+            return self._families
+
         families = []
-        for family in self.gedcom.get_families(self.element):
-            # Get partner
-            partners = []
-            for parent in self.gedcom.get_family_members(family, "PARENTS"):
-                if parent.get_pointer() != self.element.get_pointer():
-                    partners.append(Individual(parent, self.gedcom))
-
-            # Get marriage info
-            marriage_date = ""
-            marriage_place = ""
-            for child in family.get_child_elements():
-                if child.get_tag() == "MARR":
-                    for subchild in child.get_child_elements():
-                        if subchild.get_tag() == "DATE":
-                            marriage_date = subchild.get_value()
-                        elif subchild.get_tag() == "PLAC":
-                            marriage_place = subchild.get_value()
-
-            # Get children
-            children = []
-            for child in self.gedcom.get_family_members(
-                family, gedcom.tags.GEDCOM_TAG_CHILD
-            ):
-                children.append(Individual(child, self.gedcom))
+        summaries = _family_summaries(self.gedcom)
+        own_pointer = self.element.get_pointer()
+
+        for family in self._get_spouse_families():
+            summary = summaries[family.get_pointer()]
+
+            # First parent who isn't this person
+            partner = None
+            for parent in summary["parents"]:
+                if parent.get_pointer() != own_pointer:
+                    partner = Individual.for_element(parent, self.gedcom)
+                    break
 
             families.append(
                 {
-                    "partner": partners[0] if partners else None,
-                    "marriage_date": marriage_date,
-                    "marriage_place": marriage_place,
-                    "children": children,
+                    "partner": partner,
+                    "marriage_date": summary["marriage_date"],
+                    "marriage_place": summary["marriage_place"],
+                    "children": [
+                        Individual.for_element(child, self.gedcom)
+                        for child in summary["children"]
+                    ],
                 }
             )
 
+        self._families = families
         return families
 
     def get_families_as_child(self) -> List[Dict]:
         """
         Get all families where this person is a child (to find parents).
 
+        Looks the person up in an index of every family's children that is
+        built once per parser, instead of scanning all family records per call.
+
         Returns:
             List of dictionaries with family information including:
             - father: str (father's GEDCOM ID) or None
             - mother: str (mother's GEDCOM ID) or None
         """
-        families = []
-
-        # Use the python-gedcom method to get parents
-        # Then find the family record that connects them
-        parent_elements = self.gedcom.get_parents(self.element)
-
-        # Get all family records
-        for family in self.gedcom.get_root_child_elements():
-            if family.get_tag() == gedcom.tags.GEDCOM_TAG_FAMILY:
-                # Check if this person is a child in this family
-                children = self.gedcom.get_family_members(family, gedcom.tags.GEDCOM_TAG_CHILD)
-                child_pointers = [c.get_pointer() for c in children]
-
-                if self.element.get_pointer() in child_pointers:
-                    # This person is a child in this family, get the parents
-                    parents = self.gedcom.get_family_members(family, "PARENTS")
-
-                    father_id = None
-                    mother_id = None
-
-                    for parent in parents:
-                        # Determine gender to assign father/mother
-                        # Check gender tag
-                        gender = None
-                        for child_elem in parent.get_child_elements():
-                            if child_elem.get_tag() == "SEX":
-                                gender = child_elem.get_value()
-                                break
-
-                        if gender == "M":
-                            father_id = parent.get_pointer()
-                        elif gender == "F":
-                            mother_id = parent.get_pointer()
-                        else:
-                            # If no gender specified, assign to father if empty, else mother
-                            if not father_id:
-                                father_id = parent.get_pointer()
-                            elif not mother_id:
-                                mother_id = parent.get_pointer()
-
-                    families.append({
-                        "father": father_id,
-                        "mother": mother_id,
-                    })
-
-        return families
+        parents = _parents_by_child(self.gedcom).get(self.element.get_pointer(), [])
+        return [
+            {"father": father_id, "mother": mother_id}
+            for father_id, mother_id in parents
+        ]
 
     def get_events(self) -> List[Dict[str, str]]:
         """
         Collects the individual's life events found on the GEDCOM element.
-        
+
+        The list is built on first use and cached; callers must not modify it.
+
         Returns:
             List[dict]: Each dictionary represents an event with keys:
                 - 'type' (str): GEDCOM event tag (e.g., 'BIRT', 'DEAT', 'MARR', 'OCCU', 'EDUC', 'RESI', 'BURI').
@@ -307,13 +570,16 @@ class Individual:
                 - 'place' (str): Event place value if present, otherwise an empty string.
                 - 'details' (str): The raw value of the event node (empty string if absent).
         """
+        if self._events is not None:
+            return self._events
+
         events = []
 
         for child in self.element.get_child_elements():
             tag = child.get_tag()
 
             # Common event tags
-            if tag in ["BIRT", "DEAT", "MARR", "OCCU", "EDUC", "RESI", "BURI"]:
+            if tag in _EVENT_TAGS:
                 event = {
                     "type": tag,
                     "date": "",
@@ -323,13 +589,13 @@ class Individual:
 
                 # Extract date and place
                 for subchild in child.get_child_elements():
-                    if subchild.get_tag() == "DATE":
-                        event["date"] = subchild.get_value()
-                    elif subchild.get_tag() == "PLAC":
-                        event["place"] = subchild.get_value()
+                    field = _EVENT_FIELDS.get(subchild.get_tag())
+                    if field:
+                        event[field] = subchild.get_value()
 
                 events.append(event)
 
+        self._events = events
         return events
 
     def get_images(self) -> List[Dict[str, str]]:
@@ -337,33 +603,24 @@ class Individual:
         Return image/media entries referenced by this individual's OBJE nodes.
         
         Resolves OBJE references to their records and extracts FILE, TITL, and FORM values; entries without a FILE value are omitted.
-        
+        The list is built on first use and cached; callers must not modify it.
+
         Returns:
             List[Dict[str, str]]: A list of dictionaries each containing the keys 'file', 'title', and 'format'. The 'file' value is non-empty for all returned entries.
         """
+        if self._images is not None:
+            return self._images
+
         images = []
+        element_dictionary = self.gedcom.get_element_dictionary()
 
-        for child in self.element.get_child_elements():
-            if child.get_tag() == "OBJE":
-                # OBJE can have a reference or inline data
-                reference = child.get_value()
-                if reference and reference.startswith("@"):
-                    # Resolve the reference to get actual file info
-                    obje_element = self.gedcom.get_element_dictionary().get(reference)
-                    if obje_element:
-                        image_info = {"file": "", "title": "", "format": ""}
-
-                        for obje_child in obje_element.get_child_elements():
-                            if obje_child.get_tag() == "FILE":
-                                image_info["file"] = obje_child.get_value() or ""
-                            elif obje_child.get_tag() == "TITL":
-                                image_info["title"] = obje_child.get_value() or ""
-                            elif obje_child.get_tag() == "FORM":
-                                image_info["format"] = obje_child.get_value() or ""
-
-                        if image_info["file"]:
-                            images.append(image_info)
+        for child in self._get_records("OBJE"):
+            # Only references are resolved; inline OBJE data is skipped
+            image_info = _resolve_obje(child.get_value(), element_dictionary)
+            if image_info:
+                images.append(image_info)
 
+        self._images = images
         return images
 
     def get_notes(self) -> List[str]:
@@ -376,31 +633,31 @@ class Individual:
             List[str]: Note texts with continuations and referenced NOTE content merged; empty or unresolved notes are omitted.
         """
         notes = []
-
-        for child in self.element.get_child_elements():
-            if child.get_tag() == "NOTE":
-                note_text = child.get_value() or ""
-
-                # If note_text starts with @, it's a reference to a NOTE record
-                if note_text.startswith("@") and note_text.endswith("@"):
-                    # Resolve the reference
-                    note_element = self.gedcom.get_element_dictionary().get(note_text)
-                    if note_element:
-                        # Get the note text from the NOTE element
-                        note_text = note_element.get_value() or ""
-
-                        # Get continued text from the NOTE record
-                        for subchild in note_element.get_child_elements():
-                            if subchild.get_tag() in ["CONT", "CONC"]:
-                                note_text += "\n" + (subchild.get_value() or "")
-                else:
-                    # Inline note - check for continued text in subchilds
-                    for subchild in child.get_child_elements():
-                        if subchild.get_tag() in ["CONT", "CONC"]:
+        element_dictionary = self.gedcom.get_element_dictionary()
+
+        for child in self._get_records("NOTE"):
+            note_text = child.get_value() or ""
+
+            # If note_text starts with @, it's a reference to a NOTE record
+            if note_text.startswith("@") and note_text.endswith("@"):
+                # Resolve the reference
+                note_element = element_dictionary.get(note_text)
+                if note_element:
+                    # Get the note text from the NOTE element
+                    note_text = note_element.get_value() or ""
+
+                    # Get continued text from the NOTE record
+                    for subchild in note_element.get_child_elements():
+                        if subchild.get_tag() in _CONTINUATION_TAGS:
                             note_text += "\n" + (subchild.get_value() or "")
+            else:
+                # Inline note - check for continued text in subchilds
+                for subchild in child.get_child_elements():
+                    if subchild.get_tag() in _CONTINUATION_TAGS:
+                        note_text += "\n" + (subchild.get_value() or "")
 
-                if note_text and not note_text.startswith("@"):
-                    notes.append(note_text.strip())
+            if note_text and not note_text.startswith("@"):
+                notes.append(note_text.strip())
 
         return notes
 
@@ -424,86 +681,62 @@ class Individual:
             List[Dict]: list of story dictionaries; empty list if no stories are found.
         """
         stories = []
-
-        for child in self.element.get_child_elements():
-            if child.get_tag() == "_STO":
-                story_ref = child.get_value()
-
-                if story_ref and story_ref.startswith("@"):
-                    # Resolve the story reference
-                    story_element = self.gedcom.get_element_dictionary().get(story_ref)
-                    if story_element:
-                        story = {"title": "", "description": "", "sections": []}
-
-                        # Get main title and metadata
-                        for section in story_element.get_child_elements():
-                            tag = section.get_tag()
-
-                            if tag == "TITL":
-                                story["title"] = section.get_value() or ""
-                            elif tag == "DESC":
-                                story["description"] = section.get_value() or ""
-                            elif tag == "_STS":
-                                # Story section with inline content
-                                # Format: "1 @12375128@ _STS"
-                                # Children at level 2 contain TITL, TEXT, OBJE
-                                section_data = {
-                                    "subtitle": "",
-                                    "text": "",
-                                    "images": [],
-                                }
-
-                                # Extract content directly from child elements
-                                for sts_child in section.get_child_elements():
-                                    if sts_child.get_tag() == "TITL":
-                                        section_data["subtitle"] = (
-                                            sts_child.get_value() or ""
-                                        )
-                                    elif sts_child.get_tag() == "TEXT":
-                                        text = sts_child.get_value() or ""
-                                        # Get CONT lines
-                                        for cont in sts_child.get_child_elements():
-                                            if cont.get_tag() in ["CONT", "CONC"]:
-                                                text += "\n" + (cont.get_value() or "")
-                                        section_data["text"] = text
-                                    elif sts_child.get_tag() == "OBJE":
-                                        # Resolve image reference
-                                        img_ref = sts_child.get_value()
-                                        if img_ref and img_ref.startswith("@"):
-                                            obje_element = self.gedcom.get_element_dictionary().get(
-                                                img_ref
-                                            )
-                                            if obje_element:
-                                                image_info = {
-                                                    "file": "",
-                                                    "title": "",
-                                                    "format": "",
-                                                }
-                                                for (
-                                                    obje_child
-                                                ) in obje_element.get_child_elements():
-                                                    if obje_child.get_tag() == "FILE":
-                                                        image_info["file"] = (
-                                                            obje_child.get_value() or ""
-                                                        )
-                                                    elif obje_child.get_tag() == "TITL":
-                                                        image_info["title"] = (
-                                                            obje_child.get_value() or ""
-                                                        )
-                                                    elif obje_child.get_tag() == "FORM":
-                                                        image_info["format"] = (
-                                                            obje_child.get_value() or ""
-                                                        )
-                                                if image_info["file"]:
-                                                    section_data["images"].append(
-                                                        image_info
-                                                    )
-
-                                if section_data["subtitle"] or section_data["text"]:
-                                    story["sections"].append(section_data)
-
-                        if story["title"] or story["sections"]:
-                            stories.append(story)
+        element_dictionary = self.gedcom.get_element_dictionary()
+
+        for child in self._get_records("_STO"):
+            story_ref = child.get_value()
+
+            if story_ref and story_ref.startswith("@"):
+                # Resolve the story reference
+                story_element = element_dictionary.get(story_ref)
+                if story_element:
+                    story = {"title": "", "description": "", "sections": []}
+
+                    # Get main title and metadata
+                    for section in story_element.get_child_elements():
+                        tag = section.get_tag()
+
+                        if tag == "TITL":
+                            story["title"] = section.get_value() or ""
+                        elif tag == "DESC":
+                            story["description"] = section.get_value() or ""
+                        elif tag == "_STS":
+                            # Story section with inline content
+                            # Format: "1 @12375128@ _STS"
+                            # Children at level 2 contain TITL, TEXT, OBJE
+                            section_data = {
+                                "subtitle": "",
+                                "text": "",
+                                "images": [],
+                            }
+
+                            # Extract content directly from child elements
+                            for sts_child in section.get_child_elements():
+                                sts_tag = sts_child.get_tag()
+                                if sts_tag == "TITL":
+                                    section_data["subtitle"] = (
+                                        sts_child.get_value() or ""
+                                    )
+                                elif sts_tag == "TEXT":
+                                    text = sts_child.get_value() or ""
+                                    # Get CONT lines
+                                    for cont in sts_child.get_child_elements():
+                                        if cont.get_tag() in _CONTINUATION_TAGS:
+                                            text += "\n" + (cont.get_value() or "")
+                                    section_data["text"] = text
+                                elif sts_tag == "OBJE":
+                                    # Resolve image reference
+                                    image_info = _resolve_obje(
+                                        sts_child.get_value(), element_dictionary
+                                    )
+                                    if image_info:
+                                        section_data["images"].append(image_info)
+
+                            if section_data["subtitle"] or section_data["text"]:
+                                story["sections"].append(section_data)
+
+                    if story["title"] or story["sections"]:
+                        stories.append(story)
 
         return stories
 
@@ -521,7 +754,7 @@ class Individual:
             tag = child.get_tag()
 
             # Physical attributes
-            if tag in ["EYES", "HAIR", "HEIG"]:
+            if tag in _ATTRIBUTE_TAGS:
                 attributes[tag.lower()] = child.get_value() or ""
 
         return attributes
\ No newline at end of file
@@ -122,6 +122,7 @@ def convert_gedcom_to_markdown(
     use_flat_structure: bool = False,
     create_canvas: bool = False,
     root_id: Optional[str] = None,
+    cache_canvas: bool = False,
 ) -> int:
     """
     Convert a GEDCOM file into Obsidian-compatible Markdown notes organized on disk.
@@ -143,6 +144,9 @@ def convert_gedcom_to_markdown(
             Can be a selection number (e.g., '85') or GEDCOM ID (e.g.,
             '@I253884714@' or 'I253884714'). If not provided and create_canvas
             is True, will prompt interactively.
+        cache_canvas (bool): Whether to reuse a canvas cached in
+            `output_dir/.canvas_cache` when the GEDCOM file and root person
+            are unchanged, and to cache newly generated canvases there.
 
     Returns:
         int: 0 on success, 1 on failure.
@@ -182,7 +186,7 @@ def convert_gedcom_to_markdown(
             return 1
 
         # Wrap individuals in our data model
-        individuals = [Individual(elem, parser.parser) for elem in individual_elements]
+        individuals = [Individual.for_element(elem, parser.parser) for elem in individual_elements]
 
         # Generate canvas if requested
         if create_canvas:
@@ -192,7 +196,10 @@ def convert_gedcom_to_markdown(
             if root_person_id:
                 logger.info(f"Generating canvas with root person: {root_person_id}")
                 canvas_gen = CanvasGenerator(individuals, str(output_dir))
-                canvas_path = canvas_gen.generate_canvas(root_person_id)
+                canvas_path = canvas_gen.generate_canvas(
+                    root_person_id,
+                    source_path=str(gedcom_file) if cache_canvas else None,
+                )
                 logger.info(f"Canvas created: {canvas_path}")
             else:
                 logger.warning("No root person selected, skipping canvas generation")
@@ -357,6 +364,12 @@ def main():
         help="Root person for canvas. Can be a selection number (e.g., 85) or GEDCOM ID (e.g., @I253884714@). If not provided, will prompt interactively.",
     )
 
+    parser.add_argument(
+        "--canvas-cache",
+        action="store_true",
+        help="Reuse the canvas cached in OUTPUT/.canvas_cache when the GEDCOM file and root person are unchanged",
+    )
+
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose logging"
     )
@@ -396,6 +409,7 @@ def main():
             use_flat_structure=args.flat,
             create_canvas=args.canvas,
             root_id=args.root,
+            cache_canvas=args.canvas_cache,
         )
 
         return exit_code
@@ -278,7 +278,7 @@ class MarkdownGenerator:
         Does nothing if the individual has any families or has no children.
         """
         # Skip if we already wrote families section
-        if individual.get_families():
+        if individual.has_families():
             return
 
         children = individual.get_children()
@@ -14,6 +14,12 @@ from individual import Individual
 logger = logging.getLogger(__name__)
 
 
+def _name_sort_key(individual: Individual) -> tuple:
+    """Return the (last name, first name) sort key, reading the names only once."""
+    first_name, last_name = individual.get_names()
+    return (last_name or "", first_name or "")
+
+
 def select_root_person(individuals: List[Individual], root_id: Optional[str] = None) -> Optional[str]:
     """
     Display an interactive list of individuals and let user select root person.
@@ -32,19 +38,16 @@ def select_root_person(individuals: List[Individual], root_id: Optional[str] = N
         logger.error("No individuals provided for selection")
         return None
 
+    # Sorted by last name, then first name; only the numbered paths need it,
+    # and an out-of-range index reuses it for the interactive listing
+    sorted_individuals = None
+
     # If root_id is provided, validate it and return it
     if root_id:
         # Check if it's a numeric index (e.g., "85")
         if root_id.isdigit():
             index = int(root_id)
-            # Sort individuals the same way as interactive selection
-            sorted_individuals = sorted(
-                individuals,
-                key=lambda ind: (
-                    ind.get_names()[1] or "",  # Last name
-                    ind.get_names()[0] or ""   # First name
-                )
-            )
+            sorted_individuals = sorted(individuals, key=_name_sort_key)
 
             if 1 <= index <= len(sorted_individuals):
                 selected = sorted_individuals[index - 1]
@@ -77,14 +80,8 @@ def select_root_person(individuals: List[Individual], root_id: Optional[str] = N
             print("Falling back to interactive selection...\n")
             # Fall through to interactive selection
 
-    # Sort individuals by last name, then first name
-    sorted_individuals = sorted(
-        individuals,
-        key=lambda ind: (
-            ind.get_names()[1] or "",  # Last name
-            ind.get_names()[0] or ""   # First name
-        )
-    )
+    if sorted_individuals is None:
+        sorted_individuals = sorted(individuals, key=_name_sort_key)
 
     print("\n" + "="*80)
     print("SELECT ROOT PERSON FOR FAMILY TREE CANVAS")
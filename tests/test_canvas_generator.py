@@ -0,0 +1,352 @@
+"""
+Tests for the CanvasGenerator module.
+
+This module pins the canvas layout for a small family tree including:
+- Main tree positions (root, spouse, descendants, ancestors)
+- Parent-child and spouse edges
+- Spouse links recorded on one side only
+- Disconnected family groups
+- Canvas file output
+"""
+
+import json
+
+import pytest
+
+from canvas_generator import CanvasGenerator
+from gedcom_parser import GedcomParser
+from individual import Individual
+
+
+# Main tree rooted at John: his wife Jane, their children Alice and Bob,
+# Alice's husband Carl and daughter Dora, and John's parents Frank and Grace.
+# Only Grace lists the F3 family (one-sided spouse link). Bob's family with
+# Eve is only listed by Eve, so Eve and Finn form a separate group; Greg,
+# Hana and Ivan are an unrelated family.
+FAMILY_TREE_GEDCOM = """0 HEAD
+1 SOUR TestApp
+1 GEDC
+2 VERS 5.5.1
+1 CHAR UTF-8
+0 @I1@ INDI
+1 NAME John /Doe/
+1 SEX M
+1 BIRT
+2 DATE 1950
+1 FAMS @F1@
+1 FAMC @F3@
+0 @I2@ INDI
+1 NAME Jane /Smith/
+1 SEX F
+1 FAMS @F1@
+0 @I3@ INDI
+1 NAME Alice /Doe/
+1 SEX F
+1 BIRT
+2 DATE 1976
+1 OBJE @M1@
+1 FAMS @F2@
+1 FAMC @F1@
+0 @I4@ INDI
+1 NAME Bob /Doe/
+1 SEX M
+1 FAMC @F1@
+0 @I5@ INDI
+1 NAME Carl /Brown/
+1 SEX M
+1 FAMS @F2@
+0 @I6@ INDI
+1 NAME Dora /Brown/
+1 SEX F
+1 FAMC @F2@
+0 @I7@ INDI
+1 NAME Frank /Doe/
+1 SEX M
+0 @I8@ INDI
+1 NAME Grace /Doe/
+1 SEX F
+1 FAMS @F3@
+0 @I9@ INDI
+1 NAME Eve /Green/
+1 SEX F
+1 FAMS @F4@
+0 @I10@ INDI
+1 NAME Finn /Doe/
+1 SEX M
+1 FAMC @F4@
+0 @I11@ INDI
+1 NAME Greg /White/
+1 SEX M
+1 FAMS @F5@
+0 @I12@ INDI
+1 NAME Hana /White/
+1 SEX F
+1 FAMS @F5@
+0 @I13@ INDI
+1 NAME Ivan /White/
+1 SEX M
+1 FAMC @F5@
+0 @F1@ FAM
+1 HUSB @I1@
+1 WIFE @I2@
+1 CHIL @I3@
+1 CHIL @I4@
+0 @F2@ FAM
+1 HUSB @I5@
+1 WIFE @I3@
+1 CHIL @I6@
+0 @F3@ FAM
+1 HUSB @I7@
+1 WIFE @I8@
+1 CHIL @I1@
+0 @F4@ FAM
+1 HUSB @I4@
+1 WIFE @I9@
+1 CHIL @I10@
+0 @F5@ FAM
+1 HUSB @I11@
+1 WIFE @I12@
+1 CHIL @I13@
+0 @M1@ OBJE
+1 FILE alice.jpg
+0 TRLR
+"""
+
+
+@pytest.fixture
+def canvas(temp_dir):
+    """Generate the canvas for the family tree above, rooted at John."""
+    gedcom_file = temp_dir / "tree.ged"
+    gedcom_file.write_text(FAMILY_TREE_GEDCOM, encoding='utf-8')
+
+    parser = GedcomParser(gedcom_file)
+    individuals = [Individual(elem, parser.parser) for elem in parser.get_individuals()]
+
+    generator = CanvasGenerator(individuals, str(temp_dir))
+    canvas_path = generator.generate_canvas('@I1@')
+    return generator, canvas_path
+
+
+def _node_names(generator):
+    """Map canvas node ID -> WikiLink target of the node."""
+    return {node['id']: node['text'].split('[[')[1][:-2] for node in generator.nodes}
+
+
+def _positions(generator):
+    """Map WikiLink target -> (x, y) for every node."""
+    names = _node_names(generator)
+    return {names[node['id']]: (node['x'], node['y']) for node in generator.nodes}
+
+
+def _edges(generator):
+    """Return (from, to, label) WikiLink targets for every edge."""
+    names = _node_names(generator)
+    return [(names[edge['fromNode']], names[edge['toNode']], edge['label'])
+            for edge in generator.edges]
+
+
+class TestMainTreeLayout:
+    """Tests for the layout of people connected to the root person."""
+
+    def test_main_tree_positions(self, canvas):
+        """Test root, spouse, descendant and ancestor positions."""
+        generator, _ = canvas
+        positions = _positions(generator)
+
+        # Root at the origin, wife one couple step below
+        assert positions['Doe John 1950'] == (0, 0)
+        assert positions['Smith Jane'] == (0, 540)
+
+        # Children one generation to the left, centered on the couple
+        assert positions['Doe Alice 1976'] == (-680, -502.5)
+        assert positions['Brown Carl'] == (-680, 37.5)
+        assert positions['Doe Bob'] == (-680, 692.5)
+        assert positions['Brown Dora'] == (-1360, -407.5)
+
+        # Parents one generation to the right, growing upward from a male root
+        assert positions['Doe Frank'] == (680, 0)
+        assert positions['Doe Grace'] == (680, -540)
+
+    def test_node_height_depends_on_image(self, canvas):
+        """Test that only nodes with an image use the image height."""
+        generator, _ = canvas
+        names = _node_names(generator)
+        heights = {names[node['id']]: node['height'] for node in generator.nodes}
+
+        assert heights['Doe Alice 1976'] == CanvasGenerator.IMAGE_HEIGHT
+        assert heights['Doe John 1950'] == CanvasGenerator.NODE_BASE_HEIGHT
+
+    def test_main_tree_edges(self, canvas):
+        """Test parent-child and spouse edges within the main tree."""
+        generator, _ = canvas
+        edges = _edges(generator)
+
+        assert edges[:10] == [
+            ('Doe John 1950', 'Doe Alice 1976', 'Child'),
+            ('Doe John 1950', 'Doe Bob', 'Child'),
+            ('Doe Grace', 'Doe John 1950', 'Child'),
+            ('Smith Jane', 'Doe Alice 1976', 'Child'),
+            ('Smith Jane', 'Doe Bob', 'Child'),
+            ('Doe Alice 1976', 'Brown Dora', 'Child'),
+            ('Brown Carl', 'Brown Dora', 'Child'),
+            ('Doe John 1950', 'Smith Jane', 'Spouse'),
+            ('Doe Grace', 'Doe Frank', 'Spouse'),
+            ('Doe Alice 1976', 'Brown Carl', 'Spouse'),
+        ]
+
+    def test_edge_styles(self, canvas):
+        """Test that child edges run left to right and spouse edges are bidirectional."""
+        generator, _ = canvas
+
+        for edge in generator.edges:
+            if edge['label'] == 'Child':
+                assert (edge['fromSide'], edge['toSide']) == ('left', 'right')
+                assert 'fromEnd' not in edge
+            else:
+                assert (edge['fromSide'], edge['toSide']) == ('bottom', 'top')
+                assert edge['fromEnd'] == 'arrow'
+
+    def test_one_sided_spouse_link(self, canvas):
+        """Test that a couple listed by one partner only gets exactly one spouse edge."""
+        generator, _ = canvas
+        edges = _edges(generator)
+
+        # Only Grace lists the family, so the edge starts at her
+        spouse_edges = [e for e in edges if e[2] == 'Spouse' and 'Doe Frank' in e[:2]]
+        assert spouse_edges == [('Doe Grace', 'Doe Frank', 'Spouse')]
+
+        # Frank has no FAMS link, so no child edge starts at him
+        assert not any(e[0] == 'Doe Frank' for e in edges if e[2] == 'Child')
+
+
+class TestDisconnectedTrees:
+    """Tests for family groups not connected to the root person."""
+
+    def test_disconnected_positions(self, canvas):
+        """Test that each disconnected group is placed right of everything before it."""
+        generator, _ = canvas
+        positions = _positions(generator)
+
+        # Eve's group: right of the main tree (Frank's column + node + spacing)
+        assert positions['Green Eve'] == (1330, 0)
+        assert positions['Doe Finn'] == (650, -175.0)
+
+        # The White family: right of Eve's group
+        assert positions['White Greg'] == (1980, 0)
+        assert positions['White Hana'] == (1980, 540)
+        assert positions['White Ivan'] == (1300, 95.0)
+
+    def test_disconnected_edges(self, canvas):
+        """Test edges inside disconnected groups, which never link back to the main tree."""
+        generator, _ = canvas
+
+        assert _edges(generator)[10:] == [
+            ('Green Eve', 'Doe Finn', 'Child'),
+            ('White Greg', 'White Ivan', 'Child'),
+            ('White Hana', 'White Ivan', 'Child'),
+            ('White Greg', 'White Hana', 'Spouse'),
+        ]
+
+    def test_everyone_placed_once(self, canvas):
+        """Test that one-sided links don't duplicate main-tree people."""
+        generator, _ = canvas
+        names = list(_node_names(generator).values())
+
+        assert len(names) == 13
+        assert len(set(names)) == 13
+
+
+class TestCanvasFile:
+    """Tests for the written canvas file."""
+
+    def test_canvas_file_matches_records(self, canvas):
+        """Test that the written JSON holds exactly the generated nodes and edges."""
+        generator, canvas_path = canvas
+
+        with open(canvas_path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        assert data == {'nodes': generator.nodes, 'edges': generator.edges}
+
+
+# Three generations below Paul: Quinn (with wife Rosa) and Sam; Quinn's
+# children Tom and Uma; Tom's son Vic. No spouses of their own below Quinn,
+# so every column is a plain sibling stack.
+DESCENDANTS_GEDCOM = """0 HEAD
+1 SOUR TestApp
+1 GEDC
+2 VERS 5.5.1
+1 CHAR UTF-8
+0 @I1@ INDI
+1 NAME Paul /Stone/
+1 SEX M
+1 FAMS @F1@
+0 @I2@ INDI
+1 NAME Quinn /Stone/
+1 SEX M
+1 FAMC @F1@
+1 FAMS @F2@
+0 @I3@ INDI
+1 NAME Rosa /Stone/
+1 SEX F
+1 FAMS @F2@
+0 @I4@ INDI
+1 NAME Sam /Stone/
+1 SEX M
+1 FAMC @F1@
+0 @I5@ INDI
+1 NAME Tom /Stone/
+1 SEX M
+1 FAMC @F2@
+1 FAMS @F3@
+0 @I6@ INDI
+1 NAME Uma /Stone/
+1 SEX F
+1 FAMC @F2@
+0 @I7@ INDI
+1 NAME Vic /Stone/
+1 SEX M
+1 FAMC @F3@
+0 @F1@ FAM
+1 HUSB @I1@
+1 CHIL @I2@
+1 CHIL @I4@
+0 @F2@ FAM
+1 HUSB @I2@
+1 WIFE @I3@
+1 CHIL @I5@
+1 CHIL @I6@
+0 @F3@ FAM
+1 HUSB @I5@
+1 CHIL @I7@
+0 TRLR
+"""
+
+
+class TestDescendantLayout:
+    """Tests for the depth-first placement of descendants."""
+
+    def test_three_generations_of_descendants(self, temp_dir):
+        """Test that each child's descendants are placed before the next sibling."""
+        gedcom_file = temp_dir / "descendants.ged"
+        gedcom_file.write_text(DESCENDANTS_GEDCOM, encoding='utf-8')
+
+        parser = GedcomParser(gedcom_file)
+        individuals = [Individual(elem, parser.parser) for elem in parser.get_individuals()]
+        generator = CanvasGenerator(individuals, str(temp_dir))
+        generator.generate_canvas('@I1@')
+
+        assert _positions(generator) == {
+            'Stone Paul': (0, 0),
+            'Stone Quinn': (-680, -772.5),
+            'Stone Rosa': (-680, -232.5),
+            'Stone Tom': (-1360, -1005.0),
+            'Stone Vic': (-2040, -1180.0),
+            'Stone Uma': (-1360, -350.0),
+            'Stone Sam': (-680, 422.5),
+        }
+        # Nodes are created in placement order: Quinn's whole branch before Sam
+        assert [name for name in _node_names(generator).values()] == [
+            'Stone Paul', 'Stone Quinn', 'Stone Rosa', 'Stone Tom',
+            'Stone Vic', 'Stone Uma', 'Stone Sam',
+        ]
@@ -8,8 +8,12 @@ This module tests GEDCOM file parsing functionality including:
 - Element lookup by pointer
 """
 
+import os
+import tempfile
+
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from gedcom_parser import GedcomParser
 
@@ -50,20 +54,36 @@ class TestLineEndingFixes:
     """Tests for line ending detection and correction."""
 
     def test_fix_cr_only_line_endings(self, sample_gedcom_cr_only):
-        """Test that CR-only line endings are converted to LF."""
+        """Test that CR-only files are parsed without rewriting the input."""
         # Read the original content to verify it has CR-only
         original_content = sample_gedcom_cr_only.read_bytes()
         assert b'\r\n' not in original_content  # No CRLF
         assert b'\r' in original_content  # Has CR
 
         # Parse the file (should trigger line ending fix)
-        _parser = GedcomParser(sample_gedcom_cr_only)
+        parser = GedcomParser(sample_gedcom_cr_only)
+
+        # The converted copy was parsed line by line
+        assert len(parser.get_individuals()) == 1
+
+        # The input file itself is left untouched
+        assert sample_gedcom_cr_only.read_bytes() == original_content
+
+    def test_failed_copy_leaves_no_temp_file(self, sample_gedcom_cr_only, temp_dir, monkeypatch):
+        """Test that the temporary copy is removed if writing it fails."""
+        copy_dir = temp_dir / "tmp"
+        copy_dir.mkdir()
+        monkeypatch.setattr(tempfile, 'tempdir', str(copy_dir))
 
-        # Read the fixed content
-        fixed_content = sample_gedcom_cr_only.read_bytes()
-        assert b'\n' in fixed_content  # Has LF
-        # After fix, original CR should be replaced
-        assert fixed_content.count(b'\r\n') == 0  # No CRLF (we convert to LF only)
+        def failing_fdopen(fd, mode):
+            os.close(fd)
+            raise OSError("disk full")
+
+        with patch('gedcom_parser.os.fdopen', side_effect=failing_fdopen):
+            with pytest.raises(OSError):
+                GedcomParser(sample_gedcom_cr_only)
+
+        assert list(copy_dir.iterdir()) == []
 
     def test_no_fix_for_normal_line_endings(self, sample_gedcom_file):
         """Test that files with normal line endings are not modified."""
@@ -93,6 +113,11 @@ class TestIndividualExtraction:
         from gedcom.element.individual import IndividualElement
         assert all(isinstance(ind, IndividualElement) for ind in individuals)
 
+    def test_get_individuals_is_cached(self, sample_gedcom_file):
+        """Test that repeated calls return the cached list."""
+        parser = GedcomParser(sample_gedcom_file)
+        assert parser.get_individuals() is parser.get_individuals()
+
     def test_get_individuals_with_empty_gedcom(self, temp_dir):
         """Test that empty GEDCOM returns no individuals."""
         empty_gedcom = temp_dir / "empty.ged"
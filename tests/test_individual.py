@@ -33,6 +33,7 @@ class TestIndividualBasicInfo:
         id_value = john_doe.get_id()
         assert id_value == 'I1'
         assert '@' not in id_value
+        assert john_doe.get_id() is id_value
 
     def test_get_names(self, john_doe):
         """Test name extraction as tuple."""
@@ -40,6 +41,10 @@ class TestIndividualBasicInfo:
         assert first == 'John'
         assert last == 'Doe'
 
+    def test_get_names_is_cached(self, john_doe):
+        """Test that repeated name lookups reuse the first parse."""
+        assert john_doe.get_names() is john_doe.get_names()
+
     def test_get_full_name(self, john_doe):
         """Test full name formatting."""
         full_name = john_doe.get_full_name()
@@ -126,6 +131,13 @@ class TestBirthAndDeath:
         assert death['place'] == 'Los Angeles, USA'
         assert death['year'] == '2020'
 
+    def test_life_info_is_cached(self, john_doe):
+        """Test that birth, death and name lookups reuse the first parse."""
+        assert john_doe.get_birth_info() is john_doe.get_birth_info()
+        assert john_doe.get_death_info() is john_doe.get_death_info()
+        assert john_doe.get_file_name() is john_doe.get_file_name()
+        assert john_doe.get_full_name() is john_doe.get_full_name()
+
     def test_get_birth_info_missing(self, sample_gedcom_file):
         """Test birth info when not present."""
         gedcom_content = """0 HEAD
@@ -149,6 +161,32 @@ class TestBirthAndDeath:
         assert birth['place'] == ''
         assert birth['year'] == ''
 
+    def test_get_birth_info_year_from_irregular_date(self, sample_gedcom_file):
+        """Test that the year is found in uncertain and dual dates."""
+        gedcom_content = """0 HEAD
+1 SOUR TestApp
+1 GEDC
+2 VERS 5.5.1
+1 CHAR UTF-8
+0 @I1@ INDI
+1 NAME Test /Person/
+1 BIRT
+2 DATE 3 FEB 1913/14
+0 @I2@ INDI
+1 NAME Other /Person/
+1 BIRT
+2 DATE 1844?
+0 TRLR
+"""
+        temp_file = sample_gedcom_file.parent / "irregular_birth.ged"
+        temp_file.write_text(gedcom_content, encoding='utf-8')
+
+        parser = GedcomParser(temp_file)
+        individuals = parser.get_individuals()
+        years = [Individual(ind, parser.parser).get_birth_info()['year']
+                 for ind in individuals]
+        assert years == ['1913', '1844']
+
 
 class TestEvents:
     """Tests for event extraction."""
@@ -175,6 +213,12 @@ class TestEvents:
         assert occu['details'] == 'Engineer'
         assert occu['date'] == '1975'
 
+    def test_record_lists_are_cached(self, john_doe):
+        """Test that events, images and families are only collected once."""
+        assert john_doe.get_events() is john_doe.get_events()
+        assert john_doe.get_images() is john_doe.get_images()
+        assert john_doe.get_families() is john_doe.get_families()
+
     def test_get_events_with_all_types(self, temp_dir):
         """Test extraction of various event types."""
         gedcom_content = """0 HEAD
@@ -251,6 +295,39 @@ class TestFamilyRelationships:
         child_names = [c.get_full_name() for c in children]
         assert any('Alice' in name for name in child_names)
 
+    def test_get_families_as_child(self, parsed_gedcom):
+        """Test parent lookup through the families a person is a child in."""
+        individuals = parsed_gedcom.get_individuals()
+        john = [ind for ind in individuals if 'John' in str(ind.get_name())]
+        alice = [ind for ind in individuals if 'Alice' in str(ind.get_name())]
+
+        alice_obj = Individual(alice[0], parsed_gedcom.parser)
+        assert alice_obj.get_families_as_child() == [{'father': '@I1@', 'mother': '@I2@'}]
+
+        john_obj = Individual(john[0], parsed_gedcom.parser)
+        assert john_obj.get_families_as_child() == []
+
+    def test_for_element_shares_wrappers(self, parsed_gedcom):
+        """Test that relationship lookups reuse the interned wrappers."""
+        individuals = parsed_gedcom.get_individuals()
+        john = [ind for ind in individuals if 'John' in str(ind.get_name())]
+        alice = [ind for ind in individuals if 'Alice' in str(ind.get_name())]
+
+        john_obj = Individual.for_element(john[0], parsed_gedcom.parser)
+        alice_obj = Individual.for_element(alice[0], parsed_gedcom.parser)
+
+        assert Individual.for_element(john[0], parsed_gedcom.parser) is john_obj
+        assert john_obj.get_children()[0] is alice_obj
+
+    def test_has_families(self, parsed_gedcom):
+        """Test spouse-family detection without building family details."""
+        individuals = parsed_gedcom.get_individuals()
+        john = [ind for ind in individuals if 'John' in str(ind.get_name())]
+        alice = [ind for ind in individuals if 'Alice' in str(ind.get_name())]
+
+        assert Individual(john[0], parsed_gedcom.parser).has_families()
+        assert not Individual(alice[0], parsed_gedcom.parser).has_families()
+
     def test_get_partners(self, parsed_gedcom):
         """Test partner/spouse extraction."""
         individuals = parsed_gedcom.get_individuals()
@@ -280,6 +357,85 @@ class TestFamilyRelationships:
         assert family['marriage_place'] == 'New York, USA'
         assert len(family['children']) >= 1
 
+    def test_get_families_from_either_spouse(self, parsed_gedcom):
+        """Test that both spouses see the same family, each with the other as partner."""
+        individuals = parsed_gedcom.get_individuals()
+        john = [ind for ind in individuals if 'John' in str(ind.get_name())][0]
+        jane = [ind for ind in individuals if 'Jane' in str(ind.get_name())][0]
+
+        johns = Individual(john, parsed_gedcom.parser).get_families()[0]
+        janes = Individual(jane, parsed_gedcom.parser).get_families()[0]
+
+        assert janes['partner'].get_pointer() == john.get_pointer()
+        assert janes['marriage_date'] == johns['marriage_date']
+        assert [c.get_pointer() for c in janes['children']] == \
+            [c.get_pointer() for c in johns['children']]
+
+    def test_repeated_child_record_counted_once(self, temp_dir):
+        """Test that every relationship getter lists a twice-recorded child once."""
+        gedcom_content = """0 HEAD
+1 SOUR TestApp
+0 @I1@ INDI
+1 NAME Parent /Test/
+1 SEX M
+1 FAMS @F1@
+0 @I2@ INDI
+1 NAME Kid /Test/
+1 FAMC @F1@
+0 @F1@ FAM
+1 HUSB @I1@
+1 CHIL @I2@
+1 CHIL @I2@
+0 TRLR
+"""
+        temp_file = temp_dir / "repeated_child.ged"
+        temp_file.write_text(gedcom_content, encoding='utf-8')
+
+        parser = GedcomParser(temp_file)
+        parent_elem, kid_elem = parser.get_individuals()
+        parent = Individual(parent_elem, parser.parser)
+        kid = Individual(kid_elem, parser.parser)
+
+        assert [c.get_id() for c in parent.get_children()] == ['I2']
+        assert [c.get_id() for c in parent.get_families()[0]['children']] == ['I2']
+        assert kid.get_families_as_child() == [{'father': '@I1@', 'mother': None}]
+
+    def test_reparse_drops_cached_relationships(self, parsed_gedcom, temp_dir):
+        """Test that re-parsing the same parser doesn't reuse the old family index."""
+        parser = parsed_gedcom.parser
+        alice_elem = [ind for ind in parsed_gedcom.get_individuals()
+                      if 'Alice' in str(ind.get_name())][0]
+        assert Individual(alice_elem, parser).get_families_as_child() == \
+            [{'father': '@I1@', 'mother': '@I2@'}]
+
+        gedcom_content = """0 HEAD
+1 SOUR TestApp
+0 @I1@ INDI
+1 NAME Solo /Parent/
+1 SEX F
+1 FAMS @F9@
+0 @I3@ INDI
+1 NAME Alice /Other/
+1 FAMC @F9@
+0 @F9@ FAM
+1 WIFE @I1@
+1 CHIL @I3@
+0 TRLR
+"""
+        temp_file = temp_dir / "reparsed.ged"
+        temp_file.write_text(gedcom_content, encoding='utf-8')
+        parser.parse_file(str(temp_file), False)
+
+        mother_elem, alice_elem = [e for e in parser.get_root_child_elements()
+                                   if e.get_tag() == 'INDI']
+        mother = Individual.for_element(mother_elem, parser)
+
+        assert Individual(alice_elem, parser).get_families_as_child() == \
+            [{'father': None, 'mother': '@I1@'}]
+        assert [c.get_full_name() for c in mother.get_children()] == ['Alice Other']
+        assert mother.get_families()[0]['marriage_date'] == ''
+        assert mother.get_full_name() == 'Solo Parent'
+
 
 class TestImagesAndMedia:
     """Tests for image and media extraction."""
@@ -16,6 +16,7 @@ from unittest.mock import patch, MagicMock
 from io import StringIO
 
 import main
+from canvas_generator import CanvasGenerator
 from main import (
     setup_logging,
     extract_gedzip,
@@ -239,6 +240,74 @@ class TestConversionWorkflow:
         copied_files = list(output_dir.glob('*.jpg')) + list(output_dir.glob('*.png'))
         assert len(copied_files) >= 2
 
+    def _convert_with_canvas(self, gedcom_file, output_dir, root_id='@I1@', cache_canvas=True):
+        """Run a flat, index-free conversion that writes a canvas."""
+        return convert_gedcom_to_markdown(
+            gedcom_file=gedcom_file,
+            output_dir=output_dir,
+            create_index=False,
+            use_flat_structure=True,
+            create_canvas=True,
+            root_id=root_id,
+            cache_canvas=cache_canvas,
+        )
+
+    def test_convert_with_canvas_cache_is_opt_in(self, sample_gedcom_file, output_dir):
+        """Test that no canvas cache is written unless requested."""
+        assert self._convert_with_canvas(sample_gedcom_file, output_dir, cache_canvas=False) == 0
+        assert (output_dir / 'Family Tree.canvas').exists()
+        assert not (output_dir / '.canvas_cache').exists()
+
+    def test_convert_with_canvas_uses_cache(self, sample_gedcom_file, output_dir):
+        """Test that a second canvas run with unchanged input skips the layout."""
+        assert self._convert_with_canvas(sample_gedcom_file, output_dir) == 0
+        canvas_file = output_dir / 'Family Tree.canvas'
+        first_canvas = canvas_file.read_bytes()
+        canvas_file.unlink()
+
+        # A cache miss would have to lay the tree out again and fail
+        with patch.object(CanvasGenerator, '_calculate_positions',
+                          side_effect=AssertionError('layout recomputed')):
+            assert self._convert_with_canvas(sample_gedcom_file, output_dir) == 0
+
+        assert canvas_file.read_bytes() == first_canvas
+        cached_files = list((output_dir / '.canvas_cache').glob('*.canvas'))
+        assert len(cached_files) == 1
+        assert cached_files[0].read_bytes() == first_canvas
+
+    def test_convert_with_canvas_cache_misses_after_gedcom_edit(self, sample_gedcom_file, output_dir):
+        """Test that editing the GEDCOM file produces a new key and a new layout."""
+        assert self._convert_with_canvas(sample_gedcom_file, output_dir) == 0
+        cache_dir = output_dir / '.canvas_cache'
+        first_entries = sorted(p.name for p in cache_dir.glob('*.canvas'))
+
+        content = sample_gedcom_file.read_text(encoding='utf-8')
+        sample_gedcom_file.write_text(content.replace('NAME John /Doe/', 'NAME Johnny /Doe/'),
+                                      encoding='utf-8')
+
+        with patch.object(CanvasGenerator, '_calculate_positions', autospec=True,
+                          side_effect=CanvasGenerator._calculate_positions) as layout:
+            assert self._convert_with_canvas(sample_gedcom_file, output_dir) == 0
+        layout.assert_called_once()
+
+        assert 'Johnny' in (output_dir / 'Family Tree.canvas').read_text(encoding='utf-8')
+        # The stale entry for the same root person is pruned
+        second_entries = sorted(p.name for p in cache_dir.glob('*.canvas'))
+        assert len(second_entries) == 1
+        assert second_entries != first_entries
+
+    def test_convert_with_canvas_cache_is_per_root(self, sample_gedcom_file, output_dir):
+        """Test that a different root person does not reuse the first root's canvas."""
+        assert self._convert_with_canvas(sample_gedcom_file, output_dir, root_id='@I1@') == 0
+
+        with patch.object(CanvasGenerator, '_calculate_positions', autospec=True,
+                          side_effect=CanvasGenerator._calculate_positions) as layout:
+            assert self._convert_with_canvas(sample_gedcom_file, output_dir, root_id='@I2@') == 0
+        layout.assert_called_once()
+
+        cached_files = list((output_dir / '.canvas_cache').glob('*.canvas'))
+        assert len(cached_files) == 2
+
     def test_convert_empty_gedcom(self, temp_dir, output_dir):
         """Test conversion with GEDCOM containing no individuals."""
         empty_gedcom = temp_dir / "empty.ged"